@@ -1,3 +1,14 @@
 from openpub.registry import claim
 
-__all__ = ["claim"]
+__all__ = ["claim", "verify", "VerifyReport", "ClaimResult"]
+
+
+def __getattr__(name: str):
+    # Analysis modules only need `claim`; load the verification machinery on first use
+    if name == "verify":
+        from openpub.verify_cmd import verify
+        return verify
+    if name in ("VerifyReport", "ClaimResult"):
+        from openpub import report
+        return getattr(report, name)
+    raise AttributeError(f"module 'openpub' has no attribute {name!r}")
@@ -0,0 +1,293 @@
+import ast
+import hashlib
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import Any
+
+CACHE_FILE = Path(".openpub") / "callgraph.json"
+CACHE_VERSION = 2
+
+MODULE_NODE = "<module>"
+# Marks a change the graph can't model, such as a module in a subpackage; every claim is affected
+UNMODELED = "<unmodeled>"
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def _refs_and_strings(nodes: list[ast.AST]) -> tuple[list[str], list[str]]:
+    """Collect referenced names (``x`` and ``x.attr``) and path-like string constants."""
+    refs = set()
+    strings = set()
+    for root in nodes:
+        for node in ast.walk(root):
+            if isinstance(node, ast.Name):
+                refs.add(node.id)
+            elif isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+                refs.add(f"{node.value.id}.{node.attr}")
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                s = node.value
+                if ("/" in s or "." in s) and not any(c.isspace() for c in s):
+                    strings.add(s)
+    return sorted(refs), sorted(strings)
+
+
+def _claim_keys(fn: ast.FunctionDef | ast.AsyncFunctionDef) -> list[str]:
+    """Claim IDs or family patterns registered by @claim(...) / @claim.family(...) decorators."""
+    keys = []
+    for dec in fn.decorator_list:
+        if not isinstance(dec, ast.Call) or not dec.args:
+            continue
+        func = dec.func
+        is_claim = (
+            (isinstance(func, ast.Name) and func.id == "claim")
+            or (isinstance(func, ast.Attribute) and func.attr in ("claim", "family"))
+        )
+        arg = dec.args[0]
+        if is_claim and isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+            keys.append(arg.value)
+    return keys
+
+
+def summarize_module(source: str) -> dict[str, Any]:
+    """Summarize a module's top-level functions, imports and claims for the call graph.
+
+    Each top-level function or class gets a hash of its AST (so moving code
+    around doesn't count as a change), the names it references and the
+    path-like strings it contains. Everything else at module level is lumped
+    into a single module node that every function in the module depends on.
+    """
+    tree = ast.parse(source)
+    imports: dict[str, list[str | None]] = {}
+    star_imports: list[str] = []
+    functions: dict[str, dict[str, Any]] = {}
+    claims: dict[str, str] = {}
+    module_level: list[ast.stmt] = []
+
+    for stmt in tree.body:
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            refs, strings = _refs_and_strings([stmt])
+            functions[stmt.name] = {"hash": _hash(ast.dump(stmt)), "refs": refs, "strings": strings}
+            if not isinstance(stmt, ast.ClassDef):
+                for key in _claim_keys(stmt):
+                    claims[key] = stmt.name
+            continue
+
+        module_level.append(stmt)
+        if isinstance(stmt, ast.Import):
+            for alias in stmt.names:
+                local = alias.asname or alias.name.split(".")[0]
+                imports[local] = [alias.name if alias.asname else local, None]
+        elif isinstance(stmt, ast.ImportFrom) and stmt.module:
+            for alias in stmt.names:
+                if alias.name == "*":
+                    star_imports.append(stmt.module)
+                else:
+                    imports[alias.asname or alias.name] = [stmt.module, alias.name]
+
+    refs, strings = _refs_and_strings(module_level)
+    return {
+        "module_hash": _hash("\n".join(ast.dump(stmt) for stmt in module_level)),
+        "module_refs": refs,
+        "module_strings": strings,
+        "imports": imports,
+        "star_imports": star_imports,
+        "functions": functions,
+        "claims": claims,
+    }
+
+
+def build_summaries(directory: Path) -> dict[str, dict[str, Any]]:
+    """Summarize every .py module in a directory, reusing cached summaries of unchanged files."""
+    cache_path = directory / CACHE_FILE
+    cache: dict[str, Any] = {}
+    if cache_path.exists():
+        try:
+            cache = json.loads(cache_path.read_text())
+        except json.JSONDecodeError:
+            cache = {}
+    if cache.get("version") != CACHE_VERSION:
+        cache = {"version": CACHE_VERSION, "modules": {}}
+
+    summaries = {}
+    modules = {}
+    for path in sorted(directory.glob("*.py")):
+        source = path.read_text()
+        digest = _hash(source)
+        cached = cache["modules"].get(path.stem)
+        if cached is not None and cached["hash"] == digest:
+            summary = cached["summary"]
+        else:
+            try:
+                summary = summarize_module(source)
+            except SyntaxError:
+                continue
+        summaries[path.stem] = summary
+        modules[path.stem] = {"hash": digest, "summary": summary}
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"version": CACHE_VERSION, "modules": modules}, separators=(",", ":")))
+    except OSError:
+        # The cache is only an optimization; read-only checkouts just re-parse next time
+        pass
+    return summaries
+
+
+def _resolve(ref: str, module: str, summaries: dict[str, dict[str, Any]]) -> str | None:
+    """Resolve a name referenced in ``module`` to a graph node, if it points into the project."""
+    summary = summaries[module]
+    head, _, attr = ref.partition(".")
+    if head in summary["functions"]:
+        return None if attr else f"{module}:{head}"
+    if head not in summary["imports"]:
+        return None
+    target, name = summary["imports"][head]
+    if target not in summaries:
+        return None
+    name = name or attr
+    if name and name in summaries[target]["functions"]:
+        return f"{target}:{name}"
+    return f"{target}:{MODULE_NODE}"
+
+
+def _graph(summaries: dict[str, dict[str, Any]]) -> tuple[dict[str, set[str]], dict[str, list[str]]]:
+    """Build edges between nodes, and the path-like strings held by each node."""
+    edges: dict[str, set[str]] = {}
+    strings: dict[str, list[str]] = {}
+    for module, summary in summaries.items():
+        module_node = f"{module}:{MODULE_NODE}"
+        edges[module_node] = {
+            node for ref in summary["module_refs"]
+            if (node := _resolve(ref, module, summaries)) is not None
+        }
+        # Names from `from x import *` can't be told apart, so depend on all of x
+        for target in summary["star_imports"]:
+            if target in summaries:
+                edges[module_node] |= _module_nodes(target, summaries[target])
+        strings[module_node] = summary["module_strings"]
+        for name, fn in summary["functions"].items():
+            node = f"{module}:{name}"
+            edges[node] = {module_node} | {
+                target for ref in fn["refs"]
+                if (target := _resolve(ref, module, summaries)) is not None
+            }
+            strings[node] = fn["strings"]
+    return edges, strings
+
+
+def _module_nodes(module: str, summary: dict[str, Any]) -> set[str]:
+    return {f"{module}:{MODULE_NODE}"} | {f"{module}:{name}" for name in summary["functions"]}
+
+
+def _changed_nodes(module: str, old: dict[str, Any] | None, new: dict[str, Any]) -> set[str]:
+    """Nodes of a module whose definitions differ between two summaries."""
+    if old is None:
+        return _module_nodes(module, new)
+    changed = set()
+    if old["module_hash"] != new["module_hash"]:
+        changed.add(f"{module}:{MODULE_NODE}")
+    for name, fn in new["functions"].items():
+        if old["functions"].get(name, {}).get("hash") != fn["hash"]:
+            changed.add(f"{module}:{name}")
+    return changed
+
+
+def _git(directory: Path, *args: str) -> str:
+    proc = subprocess.run(["git", "-C", str(directory), *args], capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {proc.stderr.strip()}")
+    return proc.stdout
+
+
+def changes_since(directory: Path, rev: str) -> tuple[set[str], set[str]]:
+    """Changed graph nodes and changed non-Python files in a directory since a git revision.
+
+    Modified modules are compared function by function against their
+    contents at ``rev``. Untracked files count as changed. A changed .py file
+    that isn't a top-level module of the project yields ``UNMODELED``.
+    """
+    summaries = build_summaries(directory)
+    changed = _git(directory, "diff", "--name-only", "--relative", rev, "--").splitlines()
+    changed += _git(directory, "ls-files", "--others", "--exclude-standard").splitlines()
+
+    nodes: set[str] = set()
+    data: set[str] = set()
+    for path in changed:
+        p = Path(path)
+        if p.suffix == ".py" and p.parent == Path(".") and p.stem in summaries:
+            try:
+                old = summarize_module(_git(directory, "show", f"{rev}:./{path}"))
+            except (RuntimeError, SyntaxError):
+                old = None
+            nodes |= _changed_nodes(p.stem, old, summaries[p.stem])
+        elif p.suffix == ".py":
+            nodes.add(UNMODELED)
+        else:
+            data.add(path)
+    return nodes, data
+
+
+def changes_from_paths(directory: Path, paths: list[str]) -> tuple[set[str], set[str]]:
+    """Treat every function in the given modules, and the given data files, as changed.
+
+    A .py path that isn't a top-level module of the project yields ``UNMODELED``.
+    """
+    summaries = build_summaries(directory)
+    nodes: set[str] = set()
+    data: set[str] = set()
+    for path in paths:
+        rel = Path(os.path.relpath(os.path.abspath(path), directory.resolve()))
+        if rel.suffix == ".py" and rel.parent == Path(".") and rel.stem in summaries:
+            nodes |= _module_nodes(rel.stem, summaries[rel.stem])
+        elif rel.suffix == ".py":
+            nodes.add(UNMODELED)
+        else:
+            data.add(str(rel))
+    return nodes, data
+
+
+def _same_file(a: str, b: str) -> bool:
+    a = os.path.normpath(a)
+    b = os.path.normpath(b)
+    return a == b or a.endswith(os.sep + b) or b.endswith(os.sep + a)
+
+
+def affected_claims(directory: Path, nodes: set[str], data: set[str]) -> tuple[set[str], set[str]]:
+    """Claim IDs and family patterns whose verifier transitively reaches a changed node or data file.
+
+    Returns (affected, analyzed): the affected keys, and every key whose
+    registration the static analysis could see. Claims registered in ways the
+    AST can't follow (f-string IDs, loops, ``claim(...)(fn)`` calls) are in
+    neither set and must be treated as affected. If ``nodes`` contains
+    ``UNMODELED``, every analyzed claim is affected.
+    """
+    summaries = build_summaries(directory)
+    if UNMODELED in nodes:
+        analyzed = {key for summary in summaries.values() for key in summary["claims"]}
+        return set(analyzed), analyzed
+    edges, strings = _graph(summaries)
+
+    def is_changed(node: str) -> bool:
+        return node in nodes or any(_same_file(s, d) for s in strings.get(node, ()) for d in data)
+
+    affected = set()
+    analyzed = set()
+    for module, summary in summaries.items():
+        for key, fn_name in summary["claims"].items():
+            analyzed.add(key)
+            seen = set()
+            stack = [f"{module}:{fn_name}"]
+            while stack:
+                node = stack.pop()
+                if node in seen:
+                    continue
+                seen.add(node)
+                if is_changed(node):
+                    affected.add(key)
+                    break
+                stack.extend(edges.get(node, ()))
+    return affected, analyzed
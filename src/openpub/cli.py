@@ -1,7 +1,7 @@
 import click
 
-from openpub.init_cmd import run_init
-from openpub.verify_cmd import run_verify
+# Subcommand implementations are imported inside each command, so that
+# `openpub --help` and other cheap invocations only pay for loading Click.
 
 
 @click.group()
@@ -15,6 +15,8 @@ def cli():
 @click.option("-o", "--output", default=".", help="Output directory for scaffolded project.")
 def init(claims_json, output):
     """Scaffold a paper verification project from a claims JSON file."""
+    from openpub.init_cmd import run_init
+
     run_init(claims_json, output)
     click.echo(f"Scaffolded project in {output}")
 
@@ -22,7 +24,98 @@ def init(claims_json, output):
 @cli.command()
 @click.option("--claims", default="./claims.json", help="Path to claims JSON file.")
 @click.option("--dir", "directory", default=".", help="Directory to scan for .py files.")
-def verify(claims, directory):
-    """Run @claim-decorated functions and compare results against expected values."""
-    exit_code = run_verify(claims, directory)
+@click.option(
+    "--prefetch-memory",
+    default="1G",
+    show_default=True,
+    help="Memory budget for prefetching declared claim inputs (e.g. 512M, 4G; 0 disables).",
+)
+@click.option("--trace", type=click.Path(dir_okay=False), help="Write a Chrome/Perfetto trace-event timeline to this file.")
+@click.option("-k", "--select", multiple=True, help="Only verify claim IDs matching this glob (repeatable).")
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    help="Number of claims to run concurrently [default: --max-cpus, all cores with only --max-memory, else 1].",
+)
+@click.option("--max-memory", help="Memory budget for concurrently running claims (e.g. 60G).")
+@click.option("--max-cpus", type=click.IntRange(min=1), help="CPU budget for concurrently running claims.")
+@click.option("--since", metavar="REV", help="Only re-run claims affected by changes since this git revision.")
+@click.option(
+    "--affected-by",
+    multiple=True,
+    type=click.Path(),
+    help="Only re-run claims affected by this module or data file (repeatable).",
+)
+def verify(claims, directory, prefetch_memory, trace, select, jobs, max_memory, max_cpus, since, affected_by):
+    """Run @claim-decorated functions and compare results against expected values.
+
+    With --since or --affected-by, claims that cannot reach a changed function
+    or data file are reported from the previous run instead of being re-run.
+    """
+    from pathlib import Path
+
+    from openpub.hooks import register_plugin, unregister_plugin
+    from openpub.inputs import parse_size
+    from openpub.verify_cmd import run_verify
+
+    try:
+        budget = parse_size(prefetch_memory)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--prefetch-memory")
+    if max_memory is not None:
+        try:
+            max_memory = parse_size(max_memory)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--max-memory")
+
+    affected = analyzed = None
+    if since or affected_by:
+        from openpub.callgraph import affected_claims, changes_from_paths, changes_since
+
+        nodes, data = set(), set()
+        if since:
+            try:
+                nodes, data = changes_since(Path(directory), since)
+            except RuntimeError as e:
+                raise click.ClickException(str(e))
+        if affected_by:
+            more_nodes, more_data = changes_from_paths(Path(directory), list(affected_by))
+            nodes |= more_nodes
+            data |= more_data
+        affected, analyzed = affected_claims(Path(directory), nodes, data)
+
+    recorder = None
+    if trace:
+        from openpub.trace import TraceRecorder
+
+        recorder = TraceRecorder()
+        register_plugin(recorder)
+    try:
+        exit_code = run_verify(
+            claims,
+            directory,
+            prefetch_memory=budget,
+            select=select or None,
+            jobs=jobs,
+            affected=affected,
+            max_memory=max_memory,
+            max_cpus=max_cpus,
+            analyzed=analyzed,
+        )
+    finally:
+        if recorder is not None:
+            unregister_plugin(recorder)
+            recorder.write(trace)
+    raise SystemExit(exit_code)
+
+
+@cli.command()
+@click.option("--claims", default="./claims.json", help="Path to claims JSON file.")
+@click.option("--dir", "directory", default=".", help="Project directory containing stored results.")
+def recheck(claims, directory):
+    """Re-compare results stored by the last verify against current expected values."""
+    from openpub.recheck_cmd import run_recheck
+
+    exit_code = run_recheck(claims, directory)
     raise SystemExit(exit_code)
@@ -0,0 +1,36 @@
+from typing import Any
+
+_plugins: list[Any] = []
+
+
+def register_plugin(plugin: Any) -> None:
+    """Register a plugin object to receive verification lifecycle hooks.
+
+    A plugin defines any subset of these methods, called with keyword
+    arguments (possibly from worker threads):
+
+        import_start(path)              before a project module is imported
+        import_end(path, error)         after it, with the exception or None
+        claim_start(claim_id)           before a verifier runs
+        claim_end(claim_id, error)      after it, with the exception or None
+        compare_start(claim_id)         before its result is compared
+        compare_end(claim_id, failures) after, with the failure messages
+        report_start()                  before results are printed
+        report_end()                    after results are printed
+    """
+    if plugin not in _plugins:
+        _plugins.append(plugin)
+
+
+def unregister_plugin(plugin: Any) -> None:
+    """Remove a previously registered plugin."""
+    if plugin in _plugins:
+        _plugins.remove(plugin)
+
+
+def call(hook: str, **kwargs: Any) -> None:
+    """Invoke ``hook`` on every registered plugin that defines it."""
+    for plugin in _plugins:
+        fn = getattr(plugin, hook, None)
+        if fn is not None:
+            fn(**kwargs)
@@ -1,12 +1,16 @@
 import json
+import re
 import shutil
+from fnmatch import fnmatchcase
 from pathlib import Path
 from typing import Any
 
+MIN_FAMILY_SIZE = 2
+
 
 def _make_function_name(claim_id: str) -> str:
-    """Convert claim ID like 'C5' to function name like 'verify_c5'."""
-    return f"verify_{claim_id.lower()}"
+    """Convert claim ID like 'C5' or 'C10.2' to function name like 'verify_c5' or 'verify_c10_2'."""
+    return "verify_" + re.sub(r"\W", "_", claim_id.lower())
 
 
 def _format_return_value(expected: dict[str, Any], indent: int = 1) -> str:
@@ -43,25 +47,89 @@ def _format_scalar(val: Any) -> str:
     return repr(val)
 
 
+def _schema(expected: Any) -> Any:
+    """Reduce expected values to their structure: keys and value types."""
+    if isinstance(expected, dict) and "value" in expected and "tolerance" in expected:
+        return ("tolerance", type(expected["value"]).__name__)
+    if isinstance(expected, dict):
+        return tuple((key, _schema(val)) for key, val in expected.items())
+    return type(expected).__name__
+
+
+def _find_families(claims_with_expected: list[dict]) -> dict[str, list[dict]]:
+    """Group claims like C10.1, C10.2, ... that share an expected schema.
+
+    Returns a mapping from glob pattern (e.g. "C10.*") to member claims. A
+    group only becomes a family if its pattern matches no other claim.
+    """
+    groups: dict[str, list[dict]] = {}
+    for c in claims_with_expected:
+        m = re.match(r"^([^*?\[\]]*[._-])[^._-]+$", c["claim_id"])
+        if m:
+            groups.setdefault(m.group(1), []).append(c)
+
+    families = {}
+    for base, members in groups.items():
+        pattern = f"{base}*"
+        if len(members) < MIN_FAMILY_SIZE:
+            continue
+        if len({_schema(c["expected"]) for c in members}) != 1:
+            continue
+        if sum(fnmatchcase(c["claim_id"], pattern) for c in claims_with_expected) != len(members):
+            continue
+        families[pattern] = members
+    return families
+
+
+def _generate_family_stub(pattern: str, members: list[dict]) -> list[str]:
+    """Generate a @claim.family stub returning expected values for every member."""
+    fn_name = _make_function_name(pattern.rstrip("*").rstrip("._-")) + "_family"
+    expected = {c["claim_id"]: c["expected"] for c in members}
+    return [
+        f'@claim.family("{pattern}")',
+        f'def {fn_name}():',
+        f'    """Verify {len(members)} claims matching {pattern}, e.g.: {members[0]["claim"][:60]}"""',
+        f'    return {_format_return_value(expected)}',
+    ]
+
+
 def generate_analysis_py(claims: list[dict]) -> str:
-    """Generate analysis.py content with stub functions for claims with expected values."""
+    """Generate analysis.py content with stub functions for claims with expected values.
+
+    Claims sharing an ID prefix and expected schema are scaffolded as a single
+    @claim.family verifier.
+    """
     lines = ['from openpub import claim', '', '']
 
     claims_with_expected = [c for c in claims if "expected" in c]
+    families = _find_families(claims_with_expected)
+    family_of = {c["claim_id"]: pattern for pattern, members in families.items() for c in members}
 
-    for i, c in enumerate(claims_with_expected):
+    stubs = []
+    for c in claims_with_expected:
         claim_id = c["claim_id"]
+        if claim_id in family_of:
+            pattern = family_of[claim_id]
+            if families[pattern][0] is c:
+                stubs.append(_generate_family_stub(pattern, families[pattern]))
+            continue
+
         fn_name = _make_function_name(claim_id)
         expected = c["expected"]
 
-        lines.append(f'@claim("{claim_id}")')
-        lines.append(f'def {fn_name}():')
-        lines.append(f'    """Verify: {c["claim"][:80]}"""')
+        stub = [
+            f'@claim("{claim_id}")',
+            f'def {fn_name}():',
+            f'    """Verify: {c["claim"][:80]}"""',
+        ]
 
         return_dict = _format_return_value(expected)
-        lines.append(f'    return {return_dict}')
+        stub.append(f'    return {return_dict}')
+        stubs.append(stub)
 
-        if i < len(claims_with_expected) - 1:
+    for i, stub in enumerate(stubs):
+        lines.extend(stub)
+        if i < len(stubs) - 1:
             lines.append('')
             lines.append('')
 
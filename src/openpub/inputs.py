@@ -0,0 +1,196 @@
+import gzip
+import io
+import os
+import threading
+from collections import deque
+from typing import BinaryIO
+
+DEFAULT_PREFETCH_MEMORY = 1 << 30  # 1 GiB
+DEFAULT_PREFETCH_WORKERS = 2
+
+_SIZE_SUFFIXES = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+_active: "Prefetcher | None" = None
+
+
+def parse_size(text: str) -> int:
+    """Parse a human-readable size like '512M' or '1.5G' into bytes."""
+    value = text.strip().upper().removesuffix("B")
+    suffix = value[-1:] if value[-1:] in _SIZE_SUFFIXES else ""
+    number = value[:-1] if suffix else value
+    try:
+        size = float(number)
+    except ValueError:
+        raise ValueError(f"Invalid size {text!r}: expected a number with optional K/M/G/T suffix") from None
+    if size < 0:
+        raise ValueError(f"Invalid size {text!r}: must not be negative")
+    return int(size * _SIZE_SUFFIXES[suffix])
+
+
+def _loaded_size(path: str) -> int | None:
+    """Estimate the in-memory size of a loaded input, or None if it can't be read."""
+    try:
+        size = os.stat(path).st_size
+        if path.endswith(".gz") and size >= 4:
+            with open(path, "rb") as f:
+                f.seek(-4, os.SEEK_END)
+                # The gzip ISIZE trailer holds the uncompressed size modulo 2**32
+                size = max(size, int.from_bytes(f.read(4), "little"))
+    except OSError:
+        return None
+    return size
+
+
+def _load(path: str, limit: int) -> bytes | None:
+    """Read a file fully into memory, decompressing .gz files.
+
+    Returns None if the contents turn out to be larger than ``limit`` bytes.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        data = f.read(limit + 1)
+    return data if len(data) <= limit else None
+
+
+class Prefetcher:
+    """Loads declared claim inputs in background threads ahead of use.
+
+    Inputs are loaded in the order claims will run. Each load reserves the
+    file's size (decompressed size for .gz) against ``budget`` bytes first and
+    waits until it fits, so loaded-but-unreleased data never exceeds the
+    budget. Files larger than the whole budget are never loaded and are
+    streamed from disk by ``open_input``. Each input is kept until every claim
+    that declared it has been released. A budget of 0 disables prefetching.
+    """
+
+    def __init__(self, plan: list[tuple[str, ...]], budget: int, workers: int = DEFAULT_PREFETCH_WORKERS):
+        self._cond = threading.Condition()
+        self._budget = budget
+        self._used = 0
+        self._refs: dict[str, int] = {}
+        self._queue: deque[str] = deque()
+        self._sizes: dict[str, int | None] = {}
+        self._loading: set[str] = set()
+        self._data: dict[str, bytes] = {}
+        self._closed = False
+
+        for paths in plan:
+            for path in paths:
+                key = os.path.abspath(path)
+                if key not in self._refs:
+                    self._queue.append(key)
+                    self._sizes[key] = _loaded_size(key) if budget > 0 else None
+                self._refs[key] = self._refs.get(key, 0) + 1
+
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"openpub-prefetch-{i}", daemon=True)
+            for i in range(min(workers, len(self._queue)) if budget > 0 else 0)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed or not self._queue:
+                        return
+                    key = self._queue[0]
+                    size = self._sizes[key]
+                    if self._refs.get(key, 0) <= 0 or size is None or size > self._budget:
+                        # Released, unreadable or too large: open_input reads it from disk
+                        self._queue.popleft()
+                        continue
+                    if self._used + size <= self._budget:
+                        break
+                    self._cond.wait()
+                self._queue.popleft()
+                self._loading.add(key)
+                self._used += size
+
+            try:
+                data = _load(key, size)
+            except Exception:
+                # Leave the error to surface when the claim opens the file itself
+                data = None
+
+            with self._cond:
+                self._loading.discard(key)
+                if not self._closed:
+                    self._used -= size
+                    if data is not None and self._refs.get(key, 0) > 0:
+                        self._data[key] = data
+                        self._used += len(data)
+                self._cond.notify_all()
+
+    def get(self, path: str) -> bytes | None:
+        """Return prefetched contents, waiting if the file is mid-load.
+
+        Returns None if the file was not declared, failed to load, or has not
+        been started yet; the caller should then read it directly.
+        """
+        key = os.path.abspath(path)
+        with self._cond:
+            while key in self._loading:
+                self._cond.wait()
+            return self._data.get(key)
+
+    def release(self, paths: tuple[str, ...]) -> None:
+        """Mark one claim's inputs as no longer needed."""
+        with self._cond:
+            for path in paths:
+                key = os.path.abspath(path)
+                self._refs[key] = self._refs.get(key, 0) - 1
+                if self._refs[key] <= 0:
+                    del self._refs[key]
+                    data = self._data.pop(key, None)
+                    if data is not None:
+                        self._used -= len(data)
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Stop loading and drop all prefetched data."""
+        with self._cond:
+            self._closed = True
+            self._data.clear()
+            self._used = 0
+            self._cond.notify_all()
+        for t in self._threads:
+            t.join()
+
+
+def start_prefetch(plan: list[tuple[str, ...]], budget: int) -> Prefetcher:
+    """Start prefetching inputs and make them available to open_input()."""
+    global _active
+    _active = Prefetcher(plan, budget)
+    return _active
+
+
+def stop_prefetch() -> None:
+    """Stop the active prefetcher, if any."""
+    global _active
+    if _active is not None:
+        _active.close()
+        _active = None
+
+
+def open_input(path: str) -> BinaryIO:
+    """Open a claim input for binary reading, decompressing .gz files.
+
+    During ``openpub verify`` this returns the prefetched contents of inputs
+    declared with ``@claim(..., inputs=[...])`` when they are ready, and
+    streams the file from disk otherwise.
+
+    Usage:
+        @claim("C4", inputs=["data/cohort.tsv.gz"])
+        def verify_c4():
+            df = pd.read_csv(open_input("data/cohort.tsv.gz"), sep="\\t")
+            ...
+    """
+    if _active is not None:
+        data = _active.get(path)
+        if data is not None:
+            return io.BytesIO(data)
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
@@ -0,0 +1,41 @@
+import json
+from pathlib import Path
+
+import click
+
+from openpub.report import OPEN, ClaimResult, VerifyReport, claim_sort_key, compare_stored, print_report
+from openpub.results import is_stale, load_results
+
+
+def run_recheck(claims_path: str, directory: str) -> int:
+    """Re-compare stored results against current expectations without running verifiers.
+
+    Returns exit code (0 = success, 1 = failures).
+    """
+    claims_file = Path(claims_path)
+    if not claims_file.exists():
+        click.secho(f"Error: claims file not found: {claims_path}", fg="red")
+        return 1
+
+    claims = json.loads(claims_file.read_text())
+    claims_with_expected = {c["claim_id"]: c for c in claims if "expected" in c}
+
+    cwd = Path(directory)
+    stored = load_results(cwd)
+
+    report = VerifyReport()
+    if not stored:
+        report.warnings.append("no stored results found; run `openpub verify` first")
+
+    for claim_id, claim_data in sorted(claims_with_expected.items(), key=lambda x: claim_sort_key(x[0])):
+        entry = stored.get(claim_id)
+        if entry is None:
+            report.results.append(ClaimResult(claim_id, OPEN))
+            continue
+
+        result = compare_stored(claim_id, claim_data["expected"], entry)
+        result.stale = is_stale(cwd, entry)
+        report.results.append(result)
+
+    print_report(report)
+    return report.exit_code
@@ -1,33 +1,145 @@
-from collections.abc import Callable
-from typing import Any
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 
-_registry: dict[str, Callable[[], Any]] = {}
+_registry: dict[str, Callable[[], object]] = {}
+_families: dict[str, Callable[[], object]] = {}
+_inputs: dict[str, tuple[str, ...]] = {}
+_resources: dict[str, tuple[int | None, int | None]] = {}
+_isolation_lock = threading.RLock()
 
 
-def claim(claim_id: str) -> Callable:
+def _declare(key: str, inputs: list[str] | None, memory: str | int | None, cpus: int | None) -> None:
+    """Record the declared inputs and resource needs of a claim or family."""
+    if inputs:
+        _inputs[key] = tuple(inputs)
+    if isinstance(memory, str):
+        from openpub.inputs import parse_size
+        memory = parse_size(memory)
+    if memory is not None or cpus is not None:
+        _resources[key] = (memory, cpus)
+
+
+def claim(
+    claim_id: str,
+    inputs: list[str] | None = None,
+    memory: str | int | None = None,
+    cpus: int | None = None,
+) -> Callable:
     """Decorator that registers a function as the verifier for a claim ID.
 
+    ``inputs`` lists the data files the verifier reads, so that they can be
+    prefetched in the background while earlier claims run. ``memory`` (bytes
+    or a size like "30G") and ``cpus`` declare what the verifier needs, so
+    that concurrent runs can be packed under a resource budget.
+
     Usage:
-        @claim("C5")
+        @claim("C5", inputs=["data/cohort.tsv.gz"], memory="30G", cpus=4)
         def verify_c5():
             return {"n_with_recurrent_variant": 89, ...}
     """
-    def decorator(fn: Callable[[], Any]) -> Callable[[], Any]:
+    def decorator(fn: Callable[[], object]) -> Callable[[], object]:
         if claim_id in _registry:
             raise ValueError(
                 f"Duplicate claim ID {claim_id!r}: "
                 f"already registered to {_registry[claim_id].__name__!r}"
             )
+        _declare(claim_id, inputs, memory, cpus)
         _registry[claim_id] = fn
         return fn
     return decorator
 
 
-def get_registry() -> dict[str, Callable[[], Any]]:
+def family(
+    pattern: str,
+    inputs: list[str] | None = None,
+    memory: str | int | None = None,
+    cpus: int | None = None,
+) -> Callable:
+    """Decorator that registers one function as the verifier for a family of claims.
+
+    ``pattern`` is a glob matched against claim IDs. The function runs once and
+    returns a mapping from member claim ID to that claim's result dict (or a
+    table with a ``to_dict(orient="index")`` method, such as a DataFrame
+    indexed by claim ID). Claims registered individually with ``@claim`` take
+    precedence over families. ``inputs``, ``memory`` and ``cpus`` are as for
+    ``@claim``.
+
+    Usage:
+        @claim.family("C10.*")
+        def verify_c10():
+            return {"C10.1": {"beta": 0.3}, "C10.2": {"beta": 0.1}, ...}
+    """
+    def decorator(fn: Callable[[], object]) -> Callable[[], object]:
+        if pattern in _families:
+            raise ValueError(
+                f"Duplicate claim family {pattern!r}: "
+                f"already registered to {_families[pattern].__name__!r}"
+            )
+        _declare(pattern, inputs, memory, cpus)
+        _families[pattern] = fn
+        return fn
+    return decorator
+
+
+claim.family = family
+
+
+def get_registry() -> dict[str, Callable[[], object]]:
     """Return a copy of the current claim registry."""
     return dict(_registry)
 
 
+def get_families() -> dict[str, Callable[[], object]]:
+    """Return a copy of the registered claim families, keyed by pattern."""
+    return dict(_families)
+
+
+def find_family(claim_id: str) -> str | None:
+    """Return the pattern of the first registered family matching a claim ID."""
+    # Imported here so that `from openpub import claim` stays cheap
+    from fnmatch import fnmatchcase
+
+    for pattern in _families:
+        if fnmatchcase(claim_id, pattern):
+            return pattern
+    return None
+
+
+def get_inputs(claim_id: str) -> tuple[str, ...]:
+    """Return the input files declared for a claim ID or family pattern."""
+    return _inputs.get(claim_id, ())
+
+
+def get_resources(claim_id: str) -> tuple[int | None, int | None]:
+    """Return the declared (memory bytes, cpus) for a claim ID or family pattern."""
+    return _resources.get(claim_id, (None, None))
+
+
 def clear_registry() -> None:
     """Clear all registered claims. Used for testing."""
     _registry.clear()
+    _families.clear()
+    _inputs.clear()
+    _resources.clear()
+
+
+@contextmanager
+def isolated_registry() -> Iterator[None]:
+    """Register claims into an empty registry, restoring the previous one on exit.
+
+    Read whatever you need with get_registry() etc. inside the block. Blocks in
+    different threads are serialized. This guards only the registry; callers
+    that touch other shared state, like verify(), need their own lock.
+    """
+    with _isolation_lock:
+        saved = (dict(_registry), dict(_families), dict(_inputs), dict(_resources))
+        clear_registry()
+        try:
+            yield
+        finally:
+            clear_registry()
+            _registry.update(saved[0])
+            _families.update(saved[1])
+            _inputs.update(saved[2])
+            _resources.update(saved[3])
@@ -0,0 +1,149 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+import click
+
+from openpub.comparison import compare_values
+
+VERIFIED = "verified"
+FAILED = "failed"
+ERROR = "error"
+OPEN = "open"
+
+
+@dataclass
+class ClaimResult:
+    """Outcome of verifying a single claim."""
+
+    claim_id: str
+    status: str
+    failures: list[str] = field(default_factory=list)
+    error: str | None = None
+    actual: dict[str, Any] | None = None
+    duration: float | None = None
+    peak_memory: int | None = None
+    stale: bool = False
+    reused: bool = False
+
+
+@dataclass
+class VerifyReport:
+    """Structured results of a verification run, in claim order.
+
+    ``duration`` of a claim is the wall time of its verifier in seconds, and
+    ``peak_memory`` the peak growth of process RSS in bytes while it ran, or
+    None if another claim ran at the same time; all members of a claim family
+    share the family verifier's measurements.
+    """
+
+    results: list[ClaimResult] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+    def __getitem__(self, claim_id: str) -> ClaimResult:
+        for r in self.results:
+            if r.claim_id == claim_id:
+                return r
+        raise KeyError(claim_id)
+
+    def _with_status(self, status: str) -> list[ClaimResult]:
+        return [r for r in self.results if r.status == status]
+
+    @property
+    def verified(self) -> list[ClaimResult]:
+        return self._with_status(VERIFIED)
+
+    @property
+    def failed(self) -> list[ClaimResult]:
+        return self._with_status(FAILED)
+
+    @property
+    def errors(self) -> list[ClaimResult]:
+        return self._with_status(ERROR)
+
+    @property
+    def open(self) -> list[ClaimResult]:
+        return self._with_status(OPEN)
+
+    @property
+    def ok(self) -> bool:
+        """True if no claim failed or errored. Open claims are allowed."""
+        return not any(r.status in (FAILED, ERROR) for r in self.results)
+
+    @property
+    def exit_code(self) -> int:
+        return 0 if self.ok else 1
+
+
+def claim_sort_key(claim_id: str) -> list[str | int]:
+    """Sort claim IDs like C1, C2, ..., C10, C10.1, C10.2 numerically."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", claim_id)]
+
+
+def compare_stored(claim_id: str, expected: Any, entry: dict[str, Any], reused: bool = False) -> ClaimResult:
+    """Compare a stored result from a previous run against expected values."""
+    failures = compare_values(expected, entry["actual"])
+    return ClaimResult(
+        claim_id,
+        FAILED if failures else VERIFIED,
+        failures=failures,
+        actual=entry["actual"],
+        reused=reused,
+    )
+
+
+def print_report(report: VerifyReport) -> None:
+    """Print colored verification results."""
+    for warning in report.warnings:
+        click.secho(f"Warning: {warning}", fg="yellow")
+
+    verified = report.verified
+    failed = report.failed
+    errors = report.errors
+    open_claims = report.open
+    stale = [r for r in report.results if r.stale]
+
+    click.echo()
+
+    if verified:
+        click.secho(f"  VERIFIED ({len(verified)})", fg="green", bold=True)
+        for r in verified:
+            click.secho(f"    {r.claim_id}", fg="green")
+
+    if failed:
+        click.echo()
+        click.secho(f"  FAILED ({len(failed)})", fg="red", bold=True)
+        for r in failed:
+            click.secho(f"    {r.claim_id}:", fg="red")
+            for f in r.failures:
+                click.secho(f"      {f}", fg="red")
+
+    if errors:
+        click.echo()
+        click.secho(f"  ERRORS ({len(errors)})", fg="yellow", bold=True)
+        for r in errors:
+            click.secho(f"    {r.claim_id}: {r.error}", fg="yellow")
+
+    if open_claims:
+        click.echo()
+        click.secho(f"  OPEN ({len(open_claims)})", fg="cyan", bold=True)
+        for r in open_claims:
+            click.secho(f"    {r.claim_id}", fg="cyan")
+
+    if stale:
+        click.echo()
+        click.secho(f"  STALE ({len(stale)})", fg="magenta", bold=True)
+        for r in stale:
+            click.secho(f"    {r.claim_id}: source or inputs changed since last verify", fg="magenta")
+
+    reused = sum(r.reused for r in report.results)
+
+    click.echo()
+    click.echo(
+        f"  {len(verified)}/{len(report.results)} verified, "
+        f"{len(failed)} failed, "
+        f"{len(errors)} errors, "
+        f"{len(open_claims)} open"
+        + (f" ({reused} from previous run)" if reused else "")
+    )
+    click.echo()
@@ -0,0 +1,133 @@
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+SAMPLE_INTERVAL = 0.02  # seconds
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = 4096
+
+
+def current_rss() -> int | None:
+    """Resident set size of this process in bytes, or None where unsupported."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def format_size(n: int) -> str:
+    """Format a byte count like '30.0G'."""
+    for suffix, scale in (("T", 1 << 40), ("G", 1 << 30), ("M", 1 << 20), ("K", 1 << 10)):
+        if n >= scale:
+            return f"{n / scale:.1f}{suffix}"
+    return f"{n}B"
+
+
+class MemorySampler:
+    """Tracks peak RSS growth of the process while each claim runs.
+
+    RSS is process-wide and can't be split between claims running at the same
+    time: others' allocations inflate a claim's growth, and their frees can
+    hide it. A claim is therefore only measured if no other claim ran at any
+    point while it did.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.enabled = current_rss() is not None
+        self._lock = threading.Lock()
+        # key -> [baseline, peak, ran alone so far]
+        self._active: dict[str, list[Any]] = {}
+        self._stop = threading.Event()
+        self._thread = None
+        if self.enabled:
+            self._thread = threading.Thread(target=self._loop, args=(interval,), name="openpub-rss", daemon=True)
+            self._thread.start()
+
+    def _loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            rss = current_rss() or 0
+            with self._lock:
+                for sample in self._active.values():
+                    sample[1] = max(sample[1], rss)
+
+    def start(self, key: str) -> None:
+        if not self.enabled:
+            return
+        rss = current_rss() or 0
+        with self._lock:
+            for sample in self._active.values():
+                sample[2] = False
+            self._active[key] = [rss, rss, not self._active]
+
+    def stop(self, key: str) -> int | None:
+        """Stop tracking a claim and return its peak RSS growth in bytes.
+
+        Returns None if another claim overlapped with it.
+        """
+        if not self.enabled:
+            return None
+        rss = current_rss() or 0
+        with self._lock:
+            baseline, peak, alone = self._active.pop(key)
+        if not alone:
+            return None
+        return max(peak, rss) - baseline
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def run_packed(
+    keys: list[str],
+    needs: dict[str, tuple[int, int]],
+    run: Callable[[str], Any],
+    jobs: int,
+    max_memory: int | None = None,
+    max_cpus: int | None = None,
+) -> dict[str, Any]:
+    """Run ``run(key)`` for each key in threads without exceeding memory and CPU budgets.
+
+    ``needs`` maps each key to (memory bytes, cpus). Keys are started in
+    order, skipping ahead to any later key that fits when the next one does
+    not. A key needing more than a whole budget is started only once nothing
+    else is running.
+    """
+    pending = list(keys)
+    running: dict[Future, str] = {}
+    used_memory = 0
+    used_cpus = 0
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="openpub-claim") as pool:
+        while pending or running:
+            for key in list(pending):
+                if len(running) >= jobs:
+                    break
+                memory, cpus = needs[key]
+                fits = (
+                    (max_memory is None or used_memory + memory <= max_memory)
+                    and (max_cpus is None or used_cpus + cpus <= max_cpus)
+                )
+                if fits or not running:
+                    pending.remove(key)
+                    running[pool.submit(run, key)] = key
+                    used_memory += memory
+                    used_cpus += cpus
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = running.pop(future)
+                memory, cpus = needs[key]
+                used_memory -= memory
+                used_cpus -= cpus
+                results[key] = future.result()
+
+    return results
@@ -0,0 +1,86 @@
+import hashlib
+import inspect
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+RESULTS_FILE = Path(".openpub") / "results.json"
+
+
+def load_results(directory: Path) -> dict[str, dict[str, Any]]:
+    """Load stored claim results from a project directory, or {} if none exist."""
+    path = directory / RESULTS_FILE
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except json.JSONDecodeError:
+        return {}
+
+
+def save_results(directory: Path, results: dict[str, dict[str, Any]]) -> None:
+    """Write stored claim results to a project directory."""
+    path = directory / RESULTS_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, sort_keys=True, separators=(",", ":")))
+
+
+def fingerprint(directory: Path, module: str | None, inputs: list[str]) -> str:
+    """Hash a verifier's module source and the size/mtime of its declared inputs."""
+    h = hashlib.sha256()
+    if module is not None:
+        try:
+            h.update((directory / module).read_bytes())
+        except OSError:
+            h.update(b"<missing module>")
+    for path in inputs:
+        try:
+            st = os.stat(path)
+            h.update(f"\0{path}:{st.st_size}:{st.st_mtime_ns}".encode())
+        except OSError:
+            h.update(f"\0{path}:<missing>".encode())
+    return h.hexdigest()[:16]
+
+
+def make_entry(
+    directory: Path,
+    fn: Callable[[], Any],
+    actual: dict[str, Any],
+    inputs: tuple[str, ...],
+    peak_memory: int | None = None,
+) -> dict[str, Any] | None:
+    """Build a stored result for a claim, or None if ``actual`` isn't JSON-serializable."""
+    try:
+        json.dumps(actual)
+    except (TypeError, ValueError):
+        return None
+
+    module = None
+    try:
+        source = inspect.getsourcefile(fn)
+    except TypeError:
+        source = None
+    if source is not None:
+        module = os.path.relpath(source, directory)
+
+    return {
+        "actual": actual,
+        "module": module,
+        "inputs": list(inputs),
+        "fingerprint": fingerprint(directory, module, list(inputs)),
+        "peak_memory": peak_memory,
+    }
+
+
+def is_stale(directory: Path, entry: dict[str, Any]) -> bool:
+    """Whether a stored result's module source or declared inputs changed since it was stored.
+
+    Only the verifier's own module is hashed; edits to helpers it imports from
+    other modules are not detected.
+    """
+    if entry.get("module") is None:
+        return True
+    current = fingerprint(directory, entry["module"], entry.get("inputs", []))
+    return current != entry.get("fingerprint")
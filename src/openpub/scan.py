@@ -0,0 +1,134 @@
+import gzip
+import os
+import threading
+from collections.abc import Callable
+from typing import Any, TextIO
+
+CHUNK_SIZE = 1 << 22  # ~4 MiB of lines per chunk
+
+_pending: dict[str, list["Reduction"]] = {}
+_lock = threading.Lock()
+
+
+class Reduction:
+    """Handle for a reducer registered against an input file.
+
+    The value is computed lazily: the first call to ``result()`` streams the
+    file once and feeds every reducer registered for that file so far.
+    """
+
+    def __init__(self, path: str, fn: Callable[[Any, Any], Any], initial: Any, per_chunk: bool):
+        self.path = path
+        self.fn = fn
+        self.per_chunk = per_chunk
+        self._acc = initial
+        self._error: BaseException | None = None
+        self._claimed = False  # set under _lock once a scan has taken this reduction
+        self._done = threading.Event()
+
+    def result(self) -> Any:
+        """Return the reduced value, running the shared scan if needed."""
+        if not self._done.is_set():
+            run_scans(self.path)
+            with _lock:
+                # Dropped by clear_scans() before any scan took it: scan for this one alone
+                orphaned = not self._claimed
+                self._claimed = True
+            if orphaned:
+                _scan(self.path, [self])
+            # Another thread may have claimed the pass; wait for it to finish
+            self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._acc
+
+    def _feed(self, rows: list[str]) -> None:
+        if self._error is not None:
+            return
+        try:
+            if self.per_chunk:
+                self._acc = self.fn(self._acc, rows)
+            else:
+                acc = self._acc
+                fn = self.fn
+                for row in rows:
+                    acc = fn(acc, row)
+                self._acc = acc
+        except Exception as e:
+            self._error = e
+
+
+def reduce(
+    path: str,
+    fn: Callable[[Any, Any], Any],
+    initial: Any = None,
+    *,
+    per_chunk: bool = False,
+) -> Reduction:
+    """Register a reducer over the rows of a text file.
+
+    ``fn(acc, row)`` is called for each line (without its trailing newline),
+    or ``fn(acc, rows)`` once per chunk of lines when ``per_chunk`` is true.
+    All reducers registered for the same file share a single pass over it.
+    Files ending in ``.gz`` are decompressed on the fly.
+
+    Usage:
+        n_rows = scan.reduce("data/cohort.tsv", lambda n, row: n + 1, 0)
+
+        @claim("C5")
+        def verify_c5():
+            return {"n_rows": n_rows.result()}
+    """
+    key = os.path.abspath(path)
+    reduction = Reduction(key, fn, initial, per_chunk)
+    with _lock:
+        _pending.setdefault(key, []).append(reduction)
+    return reduction
+
+
+def _open_text(path: str) -> TextIO:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", newline="")
+    return open(path, newline="")
+
+
+def _scan(key: str, reductions: list[Reduction]) -> None:
+    try:
+        with _open_text(key) as f:
+            while True:
+                lines = f.readlines(CHUNK_SIZE)
+                if not lines:
+                    break
+                rows = [line.rstrip("\r\n") for line in lines]
+                for r in reductions:
+                    r._feed(rows)
+    except Exception as e:
+        # Read or decode errors (truncated .gz, bad encoding) fail every reducer
+        for r in reductions:
+            r._error = e
+    finally:
+        for r in reductions:
+            r._done.set()
+
+
+def run_scans(path: str | None = None) -> None:
+    """Run the pending fused scan for one file, or for every registered file."""
+    with _lock:
+        keys = [os.path.abspath(path)] if path is not None else list(_pending)
+        batches = [(key, _pending.pop(key, [])) for key in keys]
+        for _, reductions in batches:
+            for r in reductions:
+                r._claimed = True
+    for key, reductions in batches:
+        if reductions:
+            _scan(key, reductions)
+
+
+def clear_scans() -> None:
+    """Drop all pending reducers.
+
+    A dropped reducer is no longer fed by shared scans; calling its
+    ``result()`` afterwards scans the file for that reducer alone.
+    """
+    with _lock:
+        _pending.clear()
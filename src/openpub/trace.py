@@ -0,0 +1,79 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+def _now_us() -> float:
+    return time.perf_counter_ns() / 1000
+
+
+class TraceRecorder:
+    """Plugin that records a verification run in Chrome trace-event format.
+
+    The written file opens in chrome://tracing or https://ui.perfetto.dev, with
+    one track per thread so concurrently running claims show up side by side.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._open: dict[tuple[str, str], tuple[float, int]] = {}
+        self._events: list[dict[str, Any]] = []
+        self._pid = os.getpid()
+
+    def _begin(self, cat: str, name: str) -> None:
+        with self._lock:
+            self._open[(cat, name)] = (_now_us(), threading.get_native_id())
+
+    def _end(self, cat: str, name: str, **args: Any) -> None:
+        end = _now_us()
+        with self._lock:
+            start, tid = self._open.pop((cat, name), (end, threading.get_native_id()))
+            self._events.append({
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": start,
+                "dur": end - start,
+                "pid": self._pid,
+                "tid": tid,
+                "args": args,
+            })
+
+    def import_start(self, path: Path) -> None:
+        self._begin("import", path.name)
+
+    def import_end(self, path: Path, error: Exception | None) -> None:
+        self._end("import", path.name, error=None if error is None else str(error))
+
+    def claim_start(self, claim_id: str) -> None:
+        self._begin("claim", claim_id)
+
+    def claim_end(self, claim_id: str, error: Exception | None) -> None:
+        self._end("claim", claim_id, error=None if error is None else str(error))
+
+    def compare_start(self, claim_id: str) -> None:
+        self._begin("compare", claim_id)
+
+    def compare_end(self, claim_id: str, failures: list[str]) -> None:
+        self._end("compare", claim_id, failures=len(failures))
+
+    def report_start(self) -> None:
+        self._begin("report", "report")
+
+    def report_end(self) -> None:
+        self._end("report", "report")
+
+    def write(self, path: str) -> None:
+        """Write recorded events as a trace-event JSON file."""
+        with self._lock:
+            events = sorted(self._events, key=lambda e: e["ts"])
+        metadata = {
+            "name": "process_name",
+            "ph": "M",
+            "pid": self._pid,
+            "args": {"name": "openpub verify"},
+        }
+        Path(path).write_text(json.dumps({"traceEvents": [metadata, *events], "displayTimeUnit": "ms"}))
@@ -1,12 +1,37 @@
 import importlib.util
 import json
+import os
 import sys
+import threading
+import time
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
 from pathlib import Path
+from typing import Any
 
 import click
 
+from openpub import hooks
 from openpub.comparison import compare_values
-from openpub.registry import clear_registry, get_registry
+from openpub.inputs import DEFAULT_PREFETCH_MEMORY, Prefetcher, start_prefetch, stop_prefetch
+from openpub.registry import find_family, get_families, get_inputs, get_registry, get_resources, isolated_registry
+from openpub.report import (
+    ERROR,
+    FAILED,
+    OPEN,
+    VERIFIED,
+    ClaimResult,
+    VerifyReport,
+    claim_sort_key,
+    compare_stored,
+    print_report,
+)
+from openpub.resources import MemorySampler, format_size, run_packed
+from openpub.results import is_stale, load_results, make_entry, save_results
+from openpub.scan import clear_scans
+
+_verify_lock = threading.Lock()
 
 
 def _discover_modules(directory: Path) -> list[Path]:
@@ -17,9 +42,37 @@ def _discover_modules(directory: Path) -> list[Path]:
     )
 
 
+@contextmanager
+def _project_modules(directory: Path) -> Iterator[None]:
+    """Make a project's modules importable by name (e.g. ``import utils``) for the duration of a run.
+
+    Same-named modules already in sys.modules are set aside and restored
+    afterwards, and the project's own modules and packages are removed again,
+    so runs over different projects don't collide.
+    """
+    root = str(directory.resolve())
+    names = {p.stem for p in directory.glob("*.py")} | {p.parent.name for p in directory.glob("*/__init__.py")}
+    shadowed = {
+        name: sys.modules.pop(name) for name in list(sys.modules)
+        if name.partition(".")[0] in names
+    }
+    sys.path.insert(0, root)
+    try:
+        yield
+    finally:
+        sys.path.remove(root)
+        for name in list(sys.modules):
+            if name.partition(".")[0] in names:
+                del sys.modules[name]
+        sys.modules.update(shadowed)
+
+
 def _import_module_from_path(path: Path) -> None:
     """Import a Python module from a file path, triggering @claim registrations."""
     module_name = path.stem
+    if module_name in sys.modules:
+        # Already imported by another project module
+        return
     spec = importlib.util.spec_from_file_location(module_name, path)
     if spec is None or spec.loader is None:
         return
@@ -28,116 +81,314 @@ def _import_module_from_path(path: Path) -> None:
     spec.loader.exec_module(module)
 
 
-def run_verify(claims_path: str, directory: str) -> int:
-    """Run verification of claims. Returns exit code (0 = success, 1 = failures)."""
-    claims_file = Path(claims_path)
-    if not claims_file.exists():
-        click.secho(f"Error: claims file not found: {claims_path}", fg="red")
-        return 1
+def verify(
+    claims: str | os.PathLike | list[dict[str, Any]],
+    directory: str | os.PathLike = ".",
+    select: str | Iterable[str] | None = None,
+    jobs: int | None = None,
+    prefetch_memory: int = DEFAULT_PREFETCH_MEMORY,
+    affected: Collection[str] | None = None,
+    max_memory: int | None = None,
+    max_cpus: int | None = None,
+    analyzed: Collection[str] | None = None,
+    store_results: bool = True,
+) -> VerifyReport:
+    """Run the @claim verifiers in a directory and compare them against expected values.
 
-    claims = json.loads(claims_file.read_text())
-    claims_with_expected = {c["claim_id"]: c for c in claims if "expected" in c}
+    ``claims`` is a path to a claims JSON file or an already-parsed list of
+    claims. ``select`` restricts the run to claim IDs matching a glob pattern
+    or any of several, and ``jobs`` runs up to that many verifiers concurrently
+    in threads (by default ``max_cpus``, all cores if only ``max_memory`` is set,
+    or 1). Concurrent verifiers are packed so that the memory and CPUs they
+    declare, or the peak memory measured on the previous run, stay within
+    ``max_memory`` bytes and ``max_cpus``; a verifier with neither runs alone.
 
-    # Clear registry and discover modules
-    clear_registry()
-    cwd = Path(directory)
-    for py_file in _discover_modules(cwd):
-        try:
-            _import_module_from_path(py_file)
-        except Exception as e:
-            click.secho(f"Warning: failed to import {py_file.name}: {e}", fg="yellow")
+    If ``affected`` is given, only claims whose ID or family pattern is in it
+    are re-run; the rest are re-compared from the results stored by the
+    previous run, if there are any and they aren't stale. ``analyzed`` lists
+    the keys the analysis behind ``affected`` could see; verifiers outside it
+    are always re-run. Results are stored in ``.openpub/results.json`` for
+    ``openpub recheck`` unless ``store_results`` is false; if the directory
+    isn't writable, a warning is added to the report instead.
 
-    registry = get_registry()
+    The global claim registry and sys.modules are left as they were, so
+    verify() can be called repeatedly in one process. Runs share process-wide
+    state (sys.modules, sys.path, scans and prefetching), so concurrent
+    calls from different threads are serialized rather than run in parallel.
 
-    verified = []
-    failed = []
-    errors = []
-    open_claims = []
+    Usage:
+        report = openpub.verify("claims.json", "my-paper/", jobs=4)
+        for r in report.failed:
+            print(r.claim_id, r.failures)
+    """
+    if isinstance(claims, (str, os.PathLike)):
+        claims_file = Path(claims)
+        if not claims_file.exists():
+            raise FileNotFoundError(f"Claims file not found: {claims}")
+        claims = json.loads(claims_file.read_text())
 
-    for claim_id, claim_data in sorted(claims_with_expected.items(), key=lambda x: _sort_key(x[0])):
-        expected = claim_data["expected"]
+    # Scans, prefetching, sys.modules and sys.path are process-wide
+    with _verify_lock:
+        report = VerifyReport()
 
-        if claim_id not in registry:
-            open_claims.append(claim_id)
-            continue
+        claims_with_expected = {c["claim_id"]: c for c in claims if "expected" in c}
+        if select is not None:
+            patterns = [select] if isinstance(select, str) else list(select)
+            claims_with_expected = {
+                cid: c for cid, c in claims_with_expected.items()
+                if any(fnmatchcase(cid, p) for p in patterns)
+            }
+            if not claims_with_expected:
+                report.warnings.append(f"no claims match {', '.join(map(repr, patterns))}")
+        ordered = sorted(claims_with_expected.items(), key=lambda x: claim_sort_key(x[0]))
 
-        fn = registry[claim_id]
-        try:
-            result = fn()
-        except Exception as e:
-            errors.append((claim_id, str(e)))
-            continue
+        cwd = Path(directory)
+        stored = load_results(cwd)
+
+        clear_scans()
+        with _project_modules(cwd):
+            with isolated_registry():
+                for py_file in _discover_modules(cwd):
+                    hooks.call("import_start", path=py_file)
+                    try:
+                        _import_module_from_path(py_file)
+                    except Exception as e:
+                        hooks.call("import_end", path=py_file, error=e)
+                        report.warnings.append(f"failed to import {py_file.name}: {e}")
+                    else:
+                        hooks.call("import_end", path=py_file, error=None)
+
+                registry = get_registry()
+                families = get_families()
+
+                # Resolve each claim to its verifier: an individual @claim or a family pattern
+                verifier_keys = {}
+                for claim_id, _ in ordered:
+                    key = claim_id if claim_id in registry else find_family(claim_id)
+                    if key is not None:
+                        verifier_keys[claim_id] = key
+                inputs = {key: get_inputs(key) for key in verifier_keys.values()}
+                declared = {key: get_resources(key) for key in verifier_keys.values()}
+
+            reused = set()
+            if affected is not None:
+                reused = {
+                    cid for cid, key in verifier_keys.items()
+                    if key not in affected
+                    and (analyzed is None or key in analyzed)
+                    and cid in stored
+                    and not is_stale(cwd, stored[cid])
+                }
+            keys = list(dict.fromkeys(key for cid, key in verifier_keys.items() if cid not in reused))
+
+            needs = {}
+            for key in keys:
+                memory, cpus = declared[key]
+                if memory is None:
+                    memory = _learned_memory(key, verifier_keys, stored)
+                if memory is None:
+                    # Not measured yet: count it as the whole budget so it runs alone
+                    memory = max_memory
+                needs[key] = (memory or 0, cpus or 1)
+                if max_memory is not None and needs[key][0] > max_memory:
+                    report.warnings.append(
+                        f"{key} needs {format_size(needs[key][0])} of memory, more than the "
+                        f"{format_size(max_memory)} budget; running it alone"
+                    )
+
+            if jobs is None:
+                jobs = max_cpus or ((os.cpu_count() or 1) if max_memory is not None else 1)
+
+            outcomes = _run_verifiers(
+                keys, registry, families, inputs, needs, jobs, prefetch_memory, max_memory, max_cpus,
+            )
+
+        for key, (_, _, _, peak) in outcomes.items():
+            memory = declared[key][0]
+            if memory is not None and peak is not None and peak > memory:
+                report.warnings.append(
+                    f"{key} used {format_size(peak)} of memory, more than the {format_size(memory)} it declares"
+                )
+
+        for claim_id, claim_data in ordered:
+            key = verifier_keys.get(claim_id)
+            if key is None:
+                report.results.append(ClaimResult(claim_id, OPEN))
+                continue
+
+            if claim_id in reused:
+                hooks.call("compare_start", claim_id=claim_id)
+                result = compare_stored(claim_id, claim_data["expected"], stored[claim_id], reused=True)
+                hooks.call("compare_end", claim_id=claim_id, failures=result.failures)
+                report.results.append(result)
+                continue
 
-        if not isinstance(result, dict):
-            errors.append((claim_id, f"returned {type(result).__name__}, expected dict"))
-            continue
+            result, error, duration, peak = outcomes[key]
+            if error is None and key not in registry:
+                if claim_id in result:
+                    result = result[claim_id]
+                else:
+                    error = f"family {key!r} returned no result for {claim_id}"
+            if error is None and not isinstance(result, dict):
+                error = f"returned {type(result).__name__}, expected dict"
 
-        failures = compare_values(expected, result)
-        if failures:
-            failed.append((claim_id, failures))
-        else:
-            verified.append(claim_id)
+            if error is not None:
+                report.results.append(ClaimResult(claim_id, ERROR, error=error, duration=duration, peak_memory=peak))
+                stored.pop(claim_id, None)
+                continue
 
-    # Report results
-    _print_results(verified, failed, errors, open_claims, len(claims_with_expected))
+            fn = registry[key] if key in registry else families[key]
+            if peak is None:
+                # Not measured this time (it overlapped another claim); keep the last measurement
+                peak_memory = stored.get(claim_id, {}).get("peak_memory")
+            else:
+                peak_memory = peak
+            entry = make_entry(cwd, fn, result, inputs[key], peak_memory=peak_memory)
+            if entry is None:
+                report.warnings.append(f"result of {claim_id} is not JSON-serializable; not stored for recheck")
+                stored.pop(claim_id, None)
+            else:
+                stored[claim_id] = entry
 
-    if failed or errors:
+            hooks.call("compare_start", claim_id=claim_id)
+            failures = compare_values(claim_data["expected"], result)
+            hooks.call("compare_end", claim_id=claim_id, failures=failures)
+            report.results.append(ClaimResult(
+                claim_id,
+                FAILED if failures else VERIFIED,
+                failures=failures,
+                actual=result,
+                duration=duration,
+                peak_memory=peak,
+            ))
+
+        if store_results:
+            try:
+                save_results(cwd, stored)
+            except OSError as e:
+                report.warnings.append(f"could not store results for recheck: {e}")
+        return report
+
+
+def _learned_memory(key: str, verifier_keys: dict[str, str], stored: dict[str, dict[str, Any]]) -> int | None:
+    """Peak memory measured for a verifier on the previous run, if any."""
+    peaks = [
+        stored[cid]["peak_memory"] for cid, k in verifier_keys.items()
+        if k == key and stored.get(cid, {}).get("peak_memory") is not None
+    ]
+    return max(peaks, default=None)
+
+
+def _run_verifiers(
+    keys: list[str],
+    registry: dict[str, Callable[[], Any]],
+    families: dict[str, Callable[[], Any]],
+    inputs: dict[str, tuple[str, ...]],
+    needs: dict[str, tuple[int, int]],
+    jobs: int,
+    prefetch_memory: int,
+    max_memory: int | None,
+    max_cpus: int | None,
+) -> dict[str, tuple[Any, str | None, float, int | None]]:
+    """Run each verifier once.
+
+    Returns (result, error message, seconds, peak memory growth in bytes) per
+    claim ID or family pattern. The peak is None for verifiers that overlapped
+    with another, whose memory can't be told apart.
+    """
+    # Prefetch declared inputs in run order while earlier verifiers compute
+    plan = [inputs[key] for key in keys]
+    prefetcher = start_prefetch(plan, prefetch_memory) if any(plan) else None
+    sampler = MemorySampler()
+
+    def run(key: str) -> tuple[Any, str | None, float, int | None]:
+        start = time.perf_counter()
+        sampler.start(key)
+        try:
+            if key in registry:
+                result, error = _call_verifier(key, registry[key], inputs[key], prefetcher)
+            else:
+                result, error = _call_family(key, families[key], inputs[key], prefetcher)
+        finally:
+            peak = sampler.stop(key)
+        return result, error, time.perf_counter() - start, peak
+
+    try:
+        if jobs > 1 and len(keys) > 1:
+            return run_packed(keys, needs, run, jobs, max_memory, max_cpus)
+        return {key: run(key) for key in keys}
+    finally:
+        sampler.close()
+        stop_prefetch()
+
+
+def run_verify(
+    claims_path: str,
+    directory: str,
+    prefetch_memory: int = DEFAULT_PREFETCH_MEMORY,
+    select: Iterable[str] | None = None,
+    jobs: int | None = None,
+    affected: Collection[str] | None = None,
+    max_memory: int | None = None,
+    max_cpus: int | None = None,
+    analyzed: Collection[str] | None = None,
+) -> int:
+    """Run verification of claims and print the results. Returns exit code (0 = success, 1 = failures)."""
+    if not Path(claims_path).exists():
+        click.secho(f"Error: claims file not found: {claims_path}", fg="red")
         return 1
-    return 0
-
-
-def _sort_key(claim_id: str) -> tuple[str, int]:
-    """Sort claim IDs like C1, C2, ..., C10 numerically."""
-    prefix = ""
-    num = 0
-    for i, ch in enumerate(claim_id):
-        if ch.isdigit():
-            prefix = claim_id[:i]
-            num = int(claim_id[i:])
-            break
-    return (prefix, num)
-
-
-def _print_results(
-    verified: list[str],
-    failed: list[tuple[str, list[str]]],
-    errors: list[tuple[str, str]],
-    open_claims: list[str],
-    total: int,
-) -> None:
-    """Print colored verification results."""
-    click.echo()
-
-    if verified:
-        click.secho(f"  VERIFIED ({len(verified)})", fg="green", bold=True)
-        for cid in verified:
-            click.secho(f"    {cid}", fg="green")
-
-    if failed:
-        click.echo()
-        click.secho(f"  FAILED ({len(failed)})", fg="red", bold=True)
-        for cid, failures in failed:
-            click.secho(f"    {cid}:", fg="red")
-            for f in failures:
-                click.secho(f"      {f}", fg="red")
-
-    if errors:
-        click.echo()
-        click.secho(f"  ERRORS ({len(errors)})", fg="yellow", bold=True)
-        for cid, msg in errors:
-            click.secho(f"    {cid}: {msg}", fg="yellow")
-
-    if open_claims:
-        click.echo()
-        click.secho(f"  OPEN ({len(open_claims)})", fg="cyan", bold=True)
-        for cid in open_claims:
-            click.secho(f"    {cid}", fg="cyan")
-
-    click.echo()
-    click.echo(
-        f"  {len(verified)}/{total} verified, "
-        f"{len(failed)} failed, "
-        f"{len(errors)} errors, "
-        f"{len(open_claims)} open"
+
+    report = verify(
+        claims_path,
+        directory,
+        select=select,
+        jobs=jobs,
+        prefetch_memory=prefetch_memory,
+        affected=affected,
+        max_memory=max_memory,
+        max_cpus=max_cpus,
+        analyzed=analyzed,
     )
-    click.echo()
+
+    hooks.call("report_start")
+    print_report(report)
+    hooks.call("report_end")
+
+    return report.exit_code
+
+
+def _call_verifier(
+    key: str,
+    fn: Callable[[], Any],
+    inputs: tuple[str, ...],
+    prefetcher: Prefetcher | None,
+) -> tuple[Any, str | None]:
+    """Run a verifier, returning (result, error message)."""
+    hooks.call("claim_start", claim_id=key)
+    try:
+        result = fn()
+    except Exception as e:
+        hooks.call("claim_end", claim_id=key, error=e)
+        return None, str(e)
+    finally:
+        if prefetcher is not None:
+            prefetcher.release(inputs)
+    hooks.call("claim_end", claim_id=key, error=None)
+    return result, None
+
+
+def _call_family(
+    pattern: str,
+    fn: Callable[[], Any],
+    inputs: tuple[str, ...],
+    prefetcher: Prefetcher | None,
+) -> tuple[Any, str | None]:
+    """Run a family verifier, returning (mapping of claim ID to result, error message)."""
+    result, error = _call_verifier(pattern, fn, inputs, prefetcher)
+    if error is not None:
+        return None, error
+    if not isinstance(result, Mapping) and hasattr(result, "to_dict"):
+        result = result.to_dict(orient="index")
+    if not isinstance(result, Mapping):
+        return None, f"family returned {type(result).__name__}, expected mapping of claim ID to dict"
+    return result, None
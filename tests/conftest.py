@@ -1,11 +1,14 @@
 import pytest
 
 from openpub.registry import clear_registry
+from openpub.scan import clear_scans
 
 
 @pytest.fixture(autouse=True)
 def _clear_registry():
-    """Clear the claim registry before each test."""
+    """Clear the claim registry and pending scans before each test."""
     clear_registry()
+    clear_scans()
     yield
     clear_registry()
+    clear_scans()
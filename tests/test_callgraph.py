@@ -0,0 +1,267 @@
+import json
+import subprocess
+
+from click.testing import CliRunner
+
+from openpub import verify
+from openpub.callgraph import (
+    CACHE_FILE,
+    affected_claims,
+    build_summaries,
+    changes_from_paths,
+    changes_since,
+    summarize_module,
+)
+from openpub.cli import cli
+
+UTILS = (
+    'import json\n\n'
+    'def load(path):\n'
+    '    return json.load(open(path))\n\n'
+    'def double(x):\n'
+    '    return 2 * x\n\n'
+    'def triple(x):\n'
+    '    return 3 * x\n'
+)
+
+ANALYSIS = (
+    'from openpub import claim\n'
+    'import utils\n'
+    'from utils import triple\n\n'
+    'def _n():\n'
+    '    return utils.double(5)\n\n'
+    '@claim("C1")\n'
+    'def verify_c1():\n'
+    '    return {"n": _n()}\n\n'
+    '@claim("C2")\n'
+    'def verify_c2():\n'
+    '    return {"n": triple(5)}\n\n'
+    '@claim("C3", inputs=["data/c3.json"])\n'
+    'def verify_c3():\n'
+    '    return {"n": utils.load("data/c3.json")}\n'
+)
+
+
+def _write_project(tmp_path):
+    (tmp_path / "utils.py").write_text(UTILS)
+    (tmp_path / "analysis.py").write_text(ANALYSIS)
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "c3.json").write_text("15")
+    claims = [
+        {"claim_id": "C1", "claim": "Test", "expected": {"n": 10}},
+        {"claim_id": "C2", "claim": "Test", "expected": {"n": 15}},
+        {"claim_id": "C3", "claim": "Test", "expected": {"n": 15}},
+    ]
+    claims_file = tmp_path / "claims.json"
+    claims_file.write_text(json.dumps(claims))
+    return claims_file
+
+
+def test_summarize_module():
+    summary = summarize_module(ANALYSIS)
+    assert summary["claims"] == {"C1": "verify_c1", "C2": "verify_c2", "C3": "verify_c3"}
+    assert summary["imports"]["triple"] == ["utils", "triple"]
+    assert summary["imports"]["utils"] == ["utils", None]
+    assert "utils.double" in summary["functions"]["_n"]["refs"]
+    assert "data/c3.json" in summary["functions"]["verify_c3"]["strings"]
+
+
+def test_summary_hash_ignores_position():
+    moved = summarize_module("\n\n\ndef f():\n    return 1\n")
+    assert moved["functions"]["f"]["hash"] == summarize_module("def f():\n    return 1\n")["functions"]["f"]["hash"]
+
+
+def test_family_claims_detected():
+    summary = summarize_module(
+        'from openpub import claim\n\n'
+        '@claim.family("C10.*")\n'
+        'def verify_c10():\n'
+        '    return {}\n'
+    )
+    assert summary["claims"] == {"C10.*": "verify_c10"}
+
+
+def test_affected_by_helper_function(tmp_path):
+    _write_project(tmp_path)
+    assert affected_claims(tmp_path, {"utils:double"}, set())[0] == {"C1"}
+    assert affected_claims(tmp_path, {"utils:triple"}, set())[0] == {"C2"}
+    assert affected_claims(tmp_path, {"utils:load"}, set())[0] == {"C3"}
+
+
+def test_affected_by_module_level_change(tmp_path):
+    _write_project(tmp_path)
+    # Every function in a module depends on its module-level code
+    assert affected_claims(tmp_path, {"analysis:<module>"}, set())[0] == {"C1", "C2", "C3"}
+
+
+def test_affected_through_star_import(tmp_path):
+    _write_project(tmp_path)
+    (tmp_path / "analysis.py").write_text(
+        'from openpub import claim\n'
+        'from utils import *\n\n'
+        '@claim("C1")\n'
+        'def verify_c1():\n'
+        '    return {"n": double(5)}\n'
+    )
+    assert summarize_module((tmp_path / "analysis.py").read_text())["star_imports"] == ["utils"]
+    assert affected_claims(tmp_path, {"utils:double"}, set())[0] == {"C1"}
+    nodes, data = changes_from_paths(tmp_path, [str(tmp_path / "utils.py")])
+    assert affected_claims(tmp_path, nodes, data)[0] == {"C1"}
+
+
+def test_affected_by_paths(tmp_path):
+    _write_project(tmp_path)
+    nodes, data = changes_from_paths(tmp_path, [str(tmp_path / "data" / "c3.json")])
+    assert nodes == set()
+    assert affected_claims(tmp_path, nodes, data)[0] == {"C3"}
+
+    nodes, data = changes_from_paths(tmp_path, [str(tmp_path / "utils.py")])
+    assert affected_claims(tmp_path, nodes, data)[0] == {"C1", "C2", "C3"}
+
+
+def test_summaries_cached(tmp_path, monkeypatch):
+    _write_project(tmp_path)
+    build_summaries(tmp_path)
+    assert (tmp_path / CACHE_FILE).exists()
+
+    import openpub.callgraph
+
+    def fail(source):
+        raise AssertionError("should use cache")
+
+    monkeypatch.setattr(openpub.callgraph, "summarize_module", fail)
+    assert set(build_summaries(tmp_path)) == {"analysis", "utils"}
+
+
+def test_summaries_without_writable_cache(tmp_path):
+    _write_project(tmp_path)
+    (tmp_path / CACHE_FILE.parent).write_text("")
+    assert set(build_summaries(tmp_path)) == {"analysis", "utils"}
+
+
+def test_changes_since_git_rev(tmp_path):
+    _write_project(tmp_path)
+
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=tmp_path, check=True, capture_output=True,
+        )
+
+    git("init", "-q")
+    git("add", "utils.py", "analysis.py", "data")
+    git("commit", "-q", "-m", "init")
+
+    (tmp_path / "utils.py").write_text(UTILS.replace("3 * x", "3 * x + 0"))
+    nodes, data = changes_since(tmp_path, "HEAD")
+    assert nodes == {"utils:triple"}
+    assert affected_claims(tmp_path, nodes, data)[0] == {"C2"}
+
+
+def test_verify_reuses_unaffected_results(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    claims_file = _write_project(tmp_path)
+    assert verify(claims_file, tmp_path).ok
+
+    # C1 would now fail if re-run, but it is not affected by the change
+    (tmp_path / "utils.py").write_text(UTILS.replace("2 * x", "2 * x + 1"))
+    report = verify(claims_file, tmp_path, affected={"C2"})
+    assert report.ok
+    assert [r.reused for r in report.results] == [True, False, True]
+
+
+def test_verify_affected_runs_claims_without_stored_results(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    claims_file = _write_project(tmp_path)
+    report = verify(claims_file, tmp_path, affected=set())
+    assert [r.reused for r in report.results] == [False, False, False]
+
+
+def test_verify_reruns_stale_results(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    claims_file = _write_project(tmp_path)
+    assert verify(claims_file, tmp_path).ok
+
+    # An edit to the verifier's own module makes its stored result stale
+    analysis = tmp_path / "analysis.py"
+    analysis.write_text(analysis.read_text().replace("triple(5)", "triple(6)"))
+    report = verify(claims_file, tmp_path, affected=set(), analyzed={"C1", "C2", "C3"})
+    assert [r.reused for r in report.results] == [False, False, False]
+    assert not report.ok
+
+
+def test_cli_affected_by_reruns_dynamic_claims(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "utils.py").write_text("def val(i):\n    return i\n")
+    (tmp_path / "analysis.py").write_text(
+        'from openpub import claim\n'
+        'from utils import val\n\n'
+        'for i in (1, 2):\n'
+        '    claim(f"C{i}")(lambda i=i: {"n": val(i)})\n'
+    )
+    claims = [{"claim_id": f"C{i}", "claim": "Test", "expected": {"n": i}} for i in (1, 2)]
+    claims_file = tmp_path / "claims.json"
+    claims_file.write_text(json.dumps(claims))
+    runner = CliRunner()
+    args = ["verify", "--claims", str(claims_file), "--dir", str(tmp_path)]
+    assert runner.invoke(cli, args).exit_code == 0
+
+    # The AST scan can't see these claims, so they must be re-run, not reused
+    (tmp_path / "utils.py").write_text("def val(i):\n    return 100\n")
+    result = runner.invoke(cli, [*args, "--affected-by", "utils.py"])
+    assert result.exit_code == 1
+    assert "from previous run" not in result.output
+
+
+def test_subpackage_change_affects_everything(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "__init__.py").write_text("")
+    (tmp_path / "lib" / "stats.py").write_text("def n():\n    return 1\n")
+    (tmp_path / "analysis.py").write_text(
+        'from openpub import claim\n'
+        'from lib.stats import n\n\n'
+        '@claim("C1")\n'
+        'def verify_c1():\n'
+        '    return {"n": n()}\n'
+    )
+    claims_file = tmp_path / "claims.json"
+    claims_file.write_text(json.dumps([{"claim_id": "C1", "claim": "Test", "expected": {"n": 1}}]))
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "add", "lib", "analysis.py"], cwd=tmp_path, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init"],
+        cwd=tmp_path, check=True,
+    )
+    runner = CliRunner()
+    args = ["verify", "--claims", str(claims_file), "--dir", str(tmp_path)]
+    assert runner.invoke(cli, args).exit_code == 0
+
+    (tmp_path / "lib" / "stats.py").write_text("def n():\n    return 100\n")
+    for extra in (["--affected-by", "lib/stats.py"], ["--since", "HEAD"]):
+        result = runner.invoke(cli, [*args, *extra])
+        assert result.exit_code == 1, extra
+        assert "from previous run" not in result.output
+
+
+def test_cli_affected_by(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    claims_file = _write_project(tmp_path)
+    runner = CliRunner()
+    args = ["verify", "--claims", str(claims_file), "--dir", str(tmp_path)]
+    assert runner.invoke(cli, args).exit_code == 0
+
+    result = runner.invoke(cli, [*args, "--affected-by", str(tmp_path / "data" / "c3.json")])
+    assert result.exit_code == 0
+    assert "(2 from previous run)" in result.output
+
+
+def test_cli_since_bad_rev(tmp_path):
+    claims_file = _write_project(tmp_path)
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["verify", "--claims", str(claims_file), "--dir", str(tmp_path), "--since", "no-such-rev"]
+    )
+    assert result.exit_code != 0
+    assert "git diff" in result.output
@@ -62,3 +62,10 @@ def test_verify_e2e(tmp_path):
     result = runner.invoke(cli, ["verify", "--claims", str(claims_file), "--dir", str(tmp_path)])
     assert result.exit_code == 0
     assert "VERIFIED" in result.output
+
+
+def test_recheck_help():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["recheck", "--help"])
+    assert result.exit_code == 0
+    assert "--claims" in result.output
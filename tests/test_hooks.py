@@ -0,0 +1,121 @@
+import json
+
+from click.testing import CliRunner
+
+from openpub import verify
+from openpub.cli import cli
+from openpub.hooks import register_plugin, unregister_plugin
+from openpub.verify_cmd import run_verify
+
+
+class _Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def import_start(self, path):
+        self.calls.append(("import_start", path.name))
+
+    def import_end(self, path, error):
+        self.calls.append(("import_end", path.name, error is None))
+
+    def claim_start(self, claim_id):
+        self.calls.append(("claim_start", claim_id))
+
+    def claim_end(self, claim_id, error):
+        self.calls.append(("claim_end", claim_id, error is None))
+
+    def compare_end(self, claim_id, failures):
+        self.calls.append(("compare_end", claim_id, len(failures)))
+
+    def report_start(self):
+        self.calls.append(("report_start",))
+
+
+def _write_project(tmp_path):
+    claims = [
+        {"claim_id": "C1", "claim": "Test", "expected": {"n": 10}},
+        {"claim_id": "C2", "claim": "Test", "expected": {"n": 10}},
+    ]
+    claims_file = tmp_path / "claims.json"
+    claims_file.write_text(json.dumps(claims))
+
+    analysis = tmp_path / "analysis.py"
+    analysis.write_text(
+        'from openpub import claim\n\n'
+        '@claim("C1")\n'
+        'def verify_c1():\n'
+        '    return {"n": 11}\n\n'
+        '@claim("C2")\n'
+        'def verify_c2():\n'
+        '    raise RuntimeError("oops")\n'
+    )
+    return claims_file
+
+
+def test_plugin_receives_lifecycle_hooks(tmp_path):
+    claims_file = _write_project(tmp_path)
+    recorder = _Recorder()
+    register_plugin(recorder)
+    try:
+        run_verify(str(claims_file), str(tmp_path))
+    finally:
+        unregister_plugin(recorder)
+
+    assert recorder.calls == [
+        ("import_start", "analysis.py"),
+        ("import_end", "analysis.py", True),
+        ("claim_start", "C1"),
+        ("claim_end", "C1", True),
+        ("claim_start", "C2"),
+        ("claim_end", "C2", False),
+        ("compare_end", "C1", 1),
+        ("report_start",),
+    ]
+
+
+def test_reused_results_fire_compare_hooks(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    claims_file = _write_project(tmp_path)
+    verify(claims_file, tmp_path)
+
+    recorder = _Recorder()
+    register_plugin(recorder)
+    try:
+        report = verify(claims_file, tmp_path, affected=set())
+    finally:
+        unregister_plugin(recorder)
+
+    assert report["C1"].reused
+    assert ("compare_end", "C1", 1) in recorder.calls
+    assert ("claim_start", "C1") not in recorder.calls
+
+
+def test_unregistered_plugin_not_called(tmp_path):
+    claims_file = _write_project(tmp_path)
+    recorder = _Recorder()
+    register_plugin(recorder)
+    unregister_plugin(recorder)
+    run_verify(str(claims_file), str(tmp_path))
+    assert recorder.calls == []
+
+
+def test_verify_trace_export(tmp_path):
+    claims_file = _write_project(tmp_path)
+    trace_file = tmp_path / "trace.json"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["verify", "--claims", str(claims_file), "--dir", str(tmp_path), "--trace", str(trace_file)]
+    )
+    assert result.exit_code == 1
+
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    spans = [(e["cat"], e["name"]) for e in events if e["ph"] == "X"]
+    assert spans == [
+        ("import", "analysis.py"),
+        ("claim", "C1"),
+        ("claim", "C2"),
+        ("compare", "C1"),
+        ("report", "report"),
+    ]
+    assert all(e["dur"] >= 0 for e in events if e["ph"] == "X")
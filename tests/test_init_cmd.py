@@ -69,3 +69,30 @@ def test_run_init_missing_file(tmp_path):
 
     with pytest.raises(FileNotFoundError):
         run_init(str(tmp_path / "nonexistent.json"), str(tmp_path / "out"))
+
+
+def test_generate_analysis_py_family():
+    claims = [
+        {"claim_id": "C1", "claim": "Single", "expected": {"n": 1}},
+        {"claim_id": "C10.1", "claim": "Gene A", "expected": {"beta": {"value": 0.3, "tolerance": 0.01}}},
+        {"claim_id": "C10.2", "claim": "Gene B", "expected": {"beta": {"value": 0.1, "tolerance": 0.01}}},
+    ]
+    code = generate_analysis_py(claims)
+    assert '@claim("C1")' in code
+    assert '@claim.family("C10.*")' in code
+    assert "def verify_c10_family():" in code
+    assert '"C10.2": {' in code
+    assert '@claim("C10.1")' not in code
+    compile(code, "analysis.py", "exec")
+
+
+def test_generate_analysis_py_no_family_for_mixed_schema():
+    claims = [
+        {"claim_id": "C10.1", "claim": "Gene A", "expected": {"beta": 0.3}},
+        {"claim_id": "C10.2", "claim": "Gene B", "expected": {"n": 4}},
+    ]
+    code = generate_analysis_py(claims)
+    assert "claim.family" not in code
+    assert '@claim("C10.1")' in code
+    assert "def verify_c10_1():" in code
+    compile(code, "analysis.py", "exec")
@@ -0,0 +1,165 @@
+import gzip
+import json
+
+import pytest
+
+from openpub import inputs
+from openpub.inputs import Prefetcher, open_input, parse_size, start_prefetch, stop_prefetch
+from openpub.verify_cmd import run_verify
+
+
+@pytest.fixture(autouse=True)
+def _stop_prefetch():
+    yield
+    stop_prefetch()
+
+
+def test_parse_size():
+    assert parse_size("0") == 0
+    assert parse_size("512") == 512
+    assert parse_size("4K") == 4096
+    assert parse_size("1.5g") == 3 << 29
+    assert parse_size("2GB") == 2 << 30
+
+
+def test_parse_size_invalid():
+    with pytest.raises(ValueError, match="Invalid size"):
+        parse_size("lots")
+
+
+def test_prefetcher_loads_and_decompresses(tmp_path):
+    plain = tmp_path / "a.tsv"
+    plain.write_bytes(b"plain\n")
+    packed = tmp_path / "b.tsv.gz"
+    with gzip.open(packed, "wb") as f:
+        f.write(b"packed\n")
+
+    prefetcher = Prefetcher([(str(plain),), (str(packed),)], budget=1 << 20)
+    try:
+        for t in prefetcher._threads:
+            t.join()
+        assert prefetcher.get(str(plain)) == b"plain\n"
+        assert prefetcher.get(str(packed)) == b"packed\n"
+    finally:
+        prefetcher.close()
+
+
+def test_prefetcher_respects_budget(tmp_path):
+    a = tmp_path / "a.bin"
+    a.write_bytes(b"x" * 100)
+    b = tmp_path / "b.bin"
+    b.write_bytes(b"y" * 100)
+
+    prefetcher = Prefetcher([(str(a),), (str(b),)], budget=150, workers=2)
+    try:
+        # Only one file fits in the budget, so the second waits
+        with prefetcher._cond:
+            prefetcher._cond.wait_for(lambda: str(a) in prefetcher._data)
+        assert str(b) not in prefetcher._data
+        assert prefetcher._used == 100
+        prefetcher.release((str(a),))
+        with prefetcher._cond:
+            prefetcher._cond.wait_for(lambda: str(b) in prefetcher._data)
+        assert prefetcher._used == 100
+    finally:
+        prefetcher.close()
+
+
+def test_input_larger_than_budget_is_never_loaded(tmp_path, monkeypatch):
+    big = tmp_path / "big.bin"
+    big.write_bytes(b"x" * 1000)
+    packed = tmp_path / "big.tsv.gz"
+    with gzip.open(packed, "wb") as f:
+        f.write(b"y" * 1000)
+    small = tmp_path / "small.bin"
+    small.write_bytes(b"z" * 10)
+
+    loaded = []
+    real_load = inputs._load
+
+    def recording_load(path, limit):
+        loaded.append(path)
+        return real_load(path, limit)
+
+    monkeypatch.setattr(inputs, "_load", recording_load)
+
+    prefetcher = start_prefetch([(str(big),), (str(packed),), (str(small),)], budget=100)
+    for t in prefetcher._threads:
+        t.join()
+    assert loaded == [str(small)]
+    assert prefetcher._used == 10
+    with open_input(str(big)) as f:
+        assert f.read() == b"x" * 1000
+    with open_input(str(packed)) as f:
+        assert f.read() == b"y" * 1000
+
+
+def test_zero_budget_disables_prefetch(tmp_path):
+    a = tmp_path / "a.bin"
+    a.write_bytes(b"data")
+
+    prefetcher = Prefetcher([(str(a),)], budget=0)
+    try:
+        assert prefetcher._threads == []
+        assert prefetcher.get(str(a)) is None
+    finally:
+        prefetcher.close()
+
+
+def test_shared_input_kept_until_last_release(tmp_path):
+    a = tmp_path / "a.bin"
+    a.write_bytes(b"data")
+
+    prefetcher = Prefetcher([(str(a),), (str(a),)], budget=1 << 20)
+    try:
+        for t in prefetcher._threads:
+            t.join()
+        prefetcher.release((str(a),))
+        assert prefetcher.get(str(a)) == b"data"
+        prefetcher.release((str(a),))
+        assert prefetcher.get(str(a)) is None
+    finally:
+        prefetcher.close()
+
+
+def test_open_input_without_prefetch(tmp_path):
+    packed = tmp_path / "b.tsv.gz"
+    with gzip.open(packed, "wb") as f:
+        f.write(b"packed\n")
+
+    with open_input(str(packed)) as f:
+        assert f.read() == b"packed\n"
+
+
+def test_open_input_uses_active_prefetcher(tmp_path):
+    a = tmp_path / "a.bin"
+    a.write_bytes(b"data")
+
+    prefetcher = start_prefetch([(str(a),)], budget=1 << 20)
+    for t in prefetcher._threads:
+        t.join()
+    assert inputs._active is prefetcher
+    a.write_bytes(b"changed on disk")
+    assert open_input(str(a)).read() == b"data"
+
+
+def test_verify_with_declared_inputs(tmp_path):
+    data = tmp_path / "cohort.tsv.gz"
+    with gzip.open(data, "wt") as f:
+        f.write("1\n2\n3\n")
+    claims = [{"claim_id": "C1", "claim": "Test", "expected": {"n": 3}}]
+    claims_file = tmp_path / "claims.json"
+    claims_file.write_text(json.dumps(claims))
+
+    analysis = tmp_path / "analysis.py"
+    analysis.write_text(
+        'from openpub import claim\n'
+        'from openpub.inputs import open_input\n\n'
+        f'@claim("C1", inputs=[{str(data)!r}])\n'
+        'def verify_c1():\n'
+        f'    return {{"n": len(open_input({str(data)!r}).read().splitlines())}}\n'
+    )
+
+    exit_code = run_verify(str(claims_file), str(tmp_path))
+    assert exit_code == 0
+    assert inputs._active is None
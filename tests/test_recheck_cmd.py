@@ -0,0 +1,100 @@
+import json
+
+from openpub import verify
+from openpub.recheck_cmd import run_recheck
+from openpub.results import RESULTS_FILE, load_results
+from openpub.verify_cmd import run_verify
+
+
+def _write_project(tmp_path, expected, returned):
+    claims = [{"claim_id": "C1", "claim": "Test", "expected": expected}]
+    claims_file = tmp_path / "claims.json"
+    claims_file.write_text(json.dumps(claims))
+
+    analysis = tmp_path / "analysis.py"
+    analysis.write_text(
+        'from openpub import claim\n\n'
+        '@claim("C1")\n'
+        'def verify_c1():\n'
+        f'    return {returned!r}\n'
+    )
+    return claims_file
+
+
+def test_verify_stores_results(tmp_path):
+    claims_file = _write_project(tmp_path, {"n": 10}, {"n": 99})
+    assert run_verify(str(claims_file), str(tmp_path)) == 1
+
+    stored = load_results(tmp_path)
+    assert stored["C1"]["actual"] == {"n": 99}
+    assert stored["C1"]["module"] == "analysis.py"
+
+
+def test_verify_unwritable_results_warns(tmp_path):
+    claims_file = _write_project(tmp_path, {"n": 10}, {"n": 10})
+    # A file in place of the .openpub directory makes storing fail
+    (tmp_path / RESULTS_FILE.parent).write_text("")
+
+    report = verify(claims_file, tmp_path)
+    assert report["C1"].status == "verified"
+    assert len(report.warnings) == 1
+    assert report.warnings[0].startswith("could not store results for recheck")
+
+
+def test_verify_without_storing_results(tmp_path):
+    claims_file = _write_project(tmp_path, {"n": 10}, {"n": 10})
+    assert verify(claims_file, tmp_path, store_results=False).ok
+    assert not (tmp_path / RESULTS_FILE).exists()
+
+
+def test_recheck_uses_updated_expectations(tmp_path):
+    claims_file = _write_project(tmp_path, {"n": 10}, {"n": 99})
+    assert run_verify(str(claims_file), str(tmp_path)) == 1
+
+    # Only the expectation changes; recheck must not need the verifier
+    claims_file.write_text(json.dumps([{"claim_id": "C1", "claim": "Test", "expected": {"n": 99}}]))
+    (tmp_path / "analysis.py").write_text("raise RuntimeError('should not be imported')\n")
+    assert run_recheck(str(claims_file), str(tmp_path)) == 0
+
+
+def test_recheck_failure(tmp_path):
+    claims_file = _write_project(tmp_path, {"n": 10}, {"n": 10})
+    assert run_verify(str(claims_file), str(tmp_path)) == 0
+
+    claims_file.write_text(json.dumps([{"claim_id": "C1", "claim": "Test", "expected": {"n": 11}}]))
+    assert run_recheck(str(claims_file), str(tmp_path)) == 1
+
+
+def test_recheck_flags_stale(tmp_path, capsys):
+    claims_file = _write_project(tmp_path, {"n": 10}, {"n": 10})
+    assert run_verify(str(claims_file), str(tmp_path)) == 0
+
+    assert run_recheck(str(claims_file), str(tmp_path)) == 0
+    assert "STALE" not in capsys.readouterr().out
+
+    (tmp_path / "analysis.py").write_text("# edited\n")
+    assert run_recheck(str(claims_file), str(tmp_path)) == 0
+    assert "STALE (1)" in capsys.readouterr().out
+
+
+def test_recheck_without_stored_results(tmp_path, capsys):
+    claims_file = _write_project(tmp_path, {"n": 10}, {"n": 10})
+    assert run_recheck(str(claims_file), str(tmp_path)) == 0
+    out = capsys.readouterr().out
+    assert "OPEN (1)" in out
+    assert not (tmp_path / RESULTS_FILE).exists()
+
+
+def test_error_drops_stored_result(tmp_path):
+    claims_file = _write_project(tmp_path, {"n": 10}, {"n": 10})
+    assert run_verify(str(claims_file), str(tmp_path)) == 0
+    assert "C1" in load_results(tmp_path)
+
+    (tmp_path / "analysis.py").write_text(
+        'from openpub import claim\n\n'
+        '@claim("C1")\n'
+        'def verify_c1():\n'
+        '    raise RuntimeError("oops")\n'
+    )
+    assert run_verify(str(claims_file), str(tmp_path)) == 1
+    assert "C1" not in load_results(tmp_path)
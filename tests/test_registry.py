@@ -1,7 +1,7 @@
 import pytest
 
 from openpub import claim
-from openpub.registry import clear_registry, get_registry
+from openpub.registry import clear_registry, find_family, get_families, get_inputs, get_registry
 
 
 def test_register_claim():
@@ -51,3 +51,40 @@ def test_get_registry_returns_copy():
     reg = get_registry()
     reg["C99"] = lambda: {}
     assert "C99" not in get_registry()
+
+
+def test_claim_inputs():
+    @claim("C1", inputs=["data/a.tsv", "data/b.tsv.gz"])
+    def verify_c1():
+        return {}
+
+    @claim("C2")
+    def verify_c2():
+        return {}
+
+    assert get_inputs("C1") == ("data/a.tsv", "data/b.tsv.gz")
+    assert get_inputs("C2") == ()
+    clear_registry()
+    assert get_inputs("C1") == ()
+
+
+def test_register_family():
+    @claim.family("C10.*", inputs=["data/genes.tsv"])
+    def verify_c10():
+        return {}
+
+    assert get_families() == {"C10.*": verify_c10}
+    assert find_family("C10.3") == "C10.*"
+    assert find_family("C1") is None
+    assert get_inputs("C10.*") == ("data/genes.tsv",)
+
+
+def test_duplicate_family_raises():
+    @claim.family("C10.*")
+    def verify_c10():
+        return {}
+
+    with pytest.raises(ValueError, match="Duplicate claim family"):
+        @claim.family("C10.*")
+        def verify_c10_again():
+            return {}
@@ -0,0 +1,203 @@
+import json
+import threading
+import time
+
+import pytest
+
+from openpub import claim, verify
+from openpub.registry import get_resources
+from openpub.resources import MemorySampler, current_rss, format_size, run_packed
+from openpub.results import load_results
+
+
+def test_claim_resources():
+    @claim("C1", memory="2G", cpus=4)
+    def verify_c1():
+        return {}
+
+    @claim("C2")
+    def verify_c2():
+        return {}
+
+    assert get_resources("C1") == (2 << 30, 4)
+    assert get_resources("C2") == (None, None)
+
+
+def test_claim_invalid_memory():
+    with pytest.raises(ValueError, match="Invalid size"):
+        @claim("C1", memory="lots")
+        def verify_c1():
+            return {}
+
+
+def test_format_size():
+    assert format_size(512) == "512B"
+    assert format_size(30 << 30) == "30.0G"
+
+
+def _tracking_run(needs, duration=0.02):
+    lock = threading.Lock()
+    usage = {"memory": 0, "cpus": 0, "peak_memory": 0, "peak_cpus": 0, "peak_jobs": 0, "jobs": 0}
+
+    def run(key):
+        memory, cpus = needs[key]
+        with lock:
+            usage["memory"] += memory
+            usage["cpus"] += cpus
+            usage["jobs"] += 1
+            usage["peak_memory"] = max(usage["peak_memory"], usage["memory"])
+            usage["peak_cpus"] = max(usage["peak_cpus"], usage["cpus"])
+            usage["peak_jobs"] = max(usage["peak_jobs"], usage["jobs"])
+        time.sleep(duration)
+        with lock:
+            usage["memory"] -= memory
+            usage["cpus"] -= cpus
+            usage["jobs"] -= 1
+        return key
+
+    return run, usage
+
+
+def test_run_packed_respects_budgets():
+    needs = {"A": (40, 2), "B": (40, 2), "C": (10, 1), "D": (10, 1), "E": (20, 8)}
+    run, usage = _tracking_run(needs)
+
+    results = run_packed(list(needs), needs, run, jobs=8, max_memory=60, max_cpus=9)
+    assert results == {key: key for key in needs}
+    assert usage["peak_memory"] <= 60
+    assert usage["peak_cpus"] <= 9
+    # C and D are started alongside A while B waits for memory
+    assert usage["peak_jobs"] == 3
+
+
+def test_run_packed_oversized_runs_alone():
+    needs = {"A": (10, 1), "B": (100, 1), "C": (10, 1)}
+    run, usage = _tracking_run(needs)
+    order = []
+
+    def tracked(key):
+        order.append((key, usage["jobs"]))
+        return run(key)
+
+    run_packed(list(needs), needs, tracked, jobs=4, max_memory=50)
+    assert ("B", 0) in order
+
+
+@pytest.mark.skipif(current_rss() is None, reason="RSS not available on this platform")
+def test_memory_sampler_measures_growth():
+    sampler = MemorySampler(interval=0.001)
+    try:
+        sampler.start("C1")
+        block = bytearray(64 << 20)
+        time.sleep(0.01)
+        del block
+        peak = sampler.stop("C1")
+    finally:
+        sampler.close()
+    assert peak >= 32 << 20
+
+
+@pytest.mark.skipif(current_rss() is None, reason="RSS not available on this platform")
+def test_memory_sampler_skips_overlapping_claims():
+    sampler = MemorySampler()
+    try:
+        sampler.start("C1")
+        sampler.start("C2")
+        assert sampler.stop("C2") is None
+        sampler.start("C3")
+        assert sampler.stop("C3") is None
+        assert sampler.stop("C1") is None
+        sampler.start("C4")
+        assert sampler.stop("C4") is not None
+    finally:
+        sampler.close()
+
+
+@pytest.mark.skipif(current_rss() is None, reason="RSS not available on this platform")
+def test_verify_flags_memory_over_declaration(tmp_path):
+    claims = [{"claim_id": "C1", "claim": "Test", "expected": {"n": 1}}]
+    (tmp_path / "analysis.py").write_text(
+        'import time\n'
+        'from openpub import claim\n\n'
+        '@claim("C1", memory="1M")\n'
+        'def verify_c1():\n'
+        '    block = bytearray(64 << 20)\n'
+        '    time.sleep(0.05)\n'
+        '    return {"n": 1}\n'
+    )
+
+    report = verify(claims, tmp_path)
+    assert report.ok
+    assert report["C1"].peak_memory >= 32 << 20
+    assert any("more than the 1.0M it declares" in w for w in report.warnings)
+    assert load_results(tmp_path)["C1"]["peak_memory"] == report["C1"].peak_memory
+
+
+def test_verify_learns_memory_from_previous_run(tmp_path):
+    claims = [
+        {"claim_id": "C1", "claim": "Test", "expected": {"n": 1}},
+        {"claim_id": "C2", "claim": "Test", "expected": {"n": 2}},
+    ]
+    (tmp_path / "analysis.py").write_text(
+        'from openpub import claim\n\n'
+        '@claim("C1")\n'
+        'def verify_c1():\n'
+        '    return {"n": 1}\n\n'
+        '@claim("C2")\n'
+        'def verify_c2():\n'
+        '    return {"n": 2}\n'
+    )
+    assert verify(claims, tmp_path).ok
+
+    results_file = tmp_path / ".openpub" / "results.json"
+    stored = json.loads(results_file.read_text())
+    stored["C1"]["peak_memory"] = 100 << 30
+    results_file.write_text(json.dumps(stored))
+
+    report = verify(claims, tmp_path, max_memory=10 << 30)
+    assert report.ok
+    assert report.warnings == ["C1 needs 100.0G of memory, more than the 10.0G budget; running it alone"]
+
+
+def test_verify_runs_unmeasured_claims_alone(tmp_path):
+    claims = [{"claim_id": f"C{i}", "claim": "Test", "expected": {"overlap": False}} for i in range(1, 4)]
+    (tmp_path / "analysis.py").write_text(
+        'import threading, time\n'
+        'from openpub import claim\n\n'
+        'lock = threading.Lock()\n'
+        'active = [0]\n\n'
+        'def run():\n'
+        '    with lock:\n'
+        '        active[0] += 1\n'
+        '    time.sleep(0.05)\n'
+        '    overlap = active[0] > 1\n'
+        '    with lock:\n'
+        '        active[0] -= 1\n'
+        '    return {"overlap": overlap}\n\n'
+        + "".join(f'@claim("C{i}")\ndef verify_c{i}():\n    return run()\n\n' for i in range(1, 4))
+    )
+
+    report = verify(claims, tmp_path, max_memory=10 << 30, jobs=3)
+    assert report.ok
+
+
+@pytest.mark.skipif(current_rss() is None, reason="RSS not available on this platform")
+def test_verify_keeps_measurement_of_overlapping_claims(tmp_path):
+    claims = [{"claim_id": f"C{i}", "claim": "Test", "expected": {"n": i}} for i in (1, 2)]
+    (tmp_path / "analysis.py").write_text(
+        'import threading\n'
+        'from openpub import claim\n\n'
+        'barrier = threading.Barrier(2, timeout=5)\n\n'
+        + "".join(f'@claim("C{i}")\ndef verify_c{i}():\n    barrier.wait()\n    return {{"n": {i}}}\n\n' for i in (1, 2))
+    )
+    assert verify(claims, tmp_path, jobs=2).ok
+
+    results_file = tmp_path / ".openpub" / "results.json"
+    stored = json.loads(results_file.read_text())
+    stored["C1"]["peak_memory"] = 5 << 30
+    results_file.write_text(json.dumps(stored))
+
+    # Both verifiers overlap at the barrier, so neither is measured
+    report = verify(claims, tmp_path, jobs=2)
+    assert [r.peak_memory for r in report.results] == [None, None]
+    assert load_results(tmp_path)["C1"]["peak_memory"] == 5 << 30
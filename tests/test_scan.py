@@ -0,0 +1,128 @@
+import gzip
+import json
+
+import pytest
+
+from openpub import scan
+from openpub.verify_cmd import run_verify
+
+
+def test_reducers_share_one_pass(tmp_path, monkeypatch):
+    data = tmp_path / "data.tsv"
+    data.write_text("a\t1\nb\t2\nc\t3\n")
+
+    opened = []
+    real_open = scan._open_text
+
+    def counting_open(path):
+        opened.append(path)
+        return real_open(path)
+
+    monkeypatch.setattr(scan, "_open_text", counting_open)
+
+    n_rows = scan.reduce(str(data), lambda n, row: n + 1, 0)
+    total = scan.reduce(str(data), lambda s, row: s + int(row.split("\t")[1]), 0)
+
+    assert n_rows.result() == 3
+    assert total.result() == 6
+    assert len(opened) == 1
+
+
+def test_per_chunk_reducer(tmp_path):
+    data = tmp_path / "data.tsv"
+    data.write_text("x\ny\nz\n")
+
+    rows = scan.reduce(str(data), lambda acc, chunk: acc + chunk, [], per_chunk=True)
+    assert rows.result() == ["x", "y", "z"]
+
+
+def test_gzip_input(tmp_path):
+    data = tmp_path / "data.tsv.gz"
+    with gzip.open(data, "wt") as f:
+        f.write("1\n2\n")
+
+    n_rows = scan.reduce(str(data), lambda n, row: n + 1, 0)
+    assert n_rows.result() == 2
+
+
+def test_reducer_error_is_isolated(tmp_path):
+    data = tmp_path / "data.tsv"
+    data.write_text("1\n2\n")
+
+    def boom(acc, row):
+        raise RuntimeError("bad row")
+
+    broken = scan.reduce(str(data), boom, 0)
+    n_rows = scan.reduce(str(data), lambda n, row: n + 1, 0)
+
+    assert n_rows.result() == 2
+    with pytest.raises(RuntimeError, match="bad row"):
+        broken.result()
+
+
+def test_missing_file_raises(tmp_path):
+    n_rows = scan.reduce(str(tmp_path / "missing.tsv"), lambda n, row: n + 1, 0)
+    with pytest.raises(FileNotFoundError):
+        n_rows.result()
+
+
+def test_scan_in_verify(tmp_path):
+    data = tmp_path / "data.tsv"
+    data.write_text("1\n2\n3\n")
+    claims = [
+        {"claim_id": "C1", "claim": "Test", "expected": {"n": 3}},
+        {"claim_id": "C2", "claim": "Test", "expected": {"total": 6}},
+    ]
+    claims_file = tmp_path / "claims.json"
+    claims_file.write_text(json.dumps(claims))
+
+    analysis = tmp_path / "analysis.py"
+    analysis.write_text(
+        'from openpub import claim, scan\n\n'
+        f'n_rows = scan.reduce({str(data)!r}, lambda n, row: n + 1, 0)\n'
+        f'total = scan.reduce({str(data)!r}, lambda s, row: s + int(row), 0)\n\n'
+        '@claim("C1")\n'
+        'def verify_c1():\n'
+        '    return {"n": n_rows.result()}\n\n'
+        '@claim("C2")\n'
+        'def verify_c2():\n'
+        '    return {"total": total.result()}\n'
+    )
+
+    exit_code = run_verify(str(claims_file), str(tmp_path))
+    assert exit_code == 0
+
+
+def test_truncated_gzip_raises(tmp_path):
+    data = tmp_path / "data.tsv.gz"
+    data.write_bytes(gzip.compress(b"1\n2\n3\n" * 1000)[:-20])
+
+    n_rows = scan.reduce(str(data), lambda n, row: n + 1, 0)
+    total = scan.reduce(str(data), lambda s, row: s + int(row), 0)
+
+    with pytest.raises(EOFError):
+        n_rows.result()
+    with pytest.raises(EOFError):
+        total.result()
+
+
+def test_bad_encoding_raises(tmp_path):
+    data = tmp_path / "data.tsv"
+    data.write_bytes(b"1\n\xff\xfe\n")
+
+    n_rows = scan.reduce(str(data), lambda n, row: n + 1, 0)
+    other = scan.reduce(str(data), lambda n, row: n + 1, 0)
+
+    with pytest.raises(UnicodeDecodeError):
+        n_rows.result()
+    with pytest.raises(UnicodeDecodeError):
+        other.result()
+
+
+def test_result_after_clear(tmp_path):
+    data = tmp_path / "data.tsv"
+    data.write_text("1\n2\n")
+
+    n_rows = scan.reduce(str(data), lambda n, row: n + 1, 0)
+    scan.clear_scans()
+    assert n_rows.result() == 2
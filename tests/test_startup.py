@@ -0,0 +1,86 @@
+import subprocess
+import sys
+
+# Cumulative import-time budgets in microseconds, as reported by `python -X importtime`.
+# The best of a few runs is compared to keep the check stable on noisy machines.
+IMPORT_BUDGET_US = 40_000
+CLI_HELP_BUDGET_US = 100_000
+RUNS = 3
+
+CLI_HELP = "from openpub.cli import cli\ntry:\n    cli(['--help'])\nexcept SystemExit:\n    pass\n"
+
+# Modules that only verification needs, and must not load for `import openpub` or `openpub --help`
+HEAVY_MODULES = [
+    "openpub.verify_cmd",
+    "openpub.init_cmd",
+    "openpub.recheck_cmd",
+    "openpub.callgraph",
+    "openpub.comparison",
+    "json",
+    "importlib.util",
+    "concurrent.futures",
+]
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def _import_time(code: str) -> int:
+    """Total cumulative import time of top-level openpub imports, in microseconds."""
+    best = None
+    for _ in range(RUNS):
+        total = 0
+        for line in _run(code, "-X", "importtime").stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, name = line.split("|")
+            # Only top-level entries; nested imports are included in their cumulative time
+            if name.startswith(" openpub"):
+                total += int(cumulative)
+        best = total if best is None else min(best, total)
+    return best
+
+
+def _loaded_modules(code: str) -> set[str]:
+    out = _run(code + "\nimport sys\nprint('\\n'.join(sys.modules))\n").stdout
+    return set(out.split())
+
+
+def test_import_openpub_loads_only_registry():
+    loaded = _loaded_modules("import openpub")
+    assert "openpub.registry" in loaded
+    assert not loaded & {*HEAVY_MODULES, "click", "typing"}
+
+
+def test_cli_help_skips_subcommand_modules():
+    loaded = _loaded_modules(CLI_HELP)
+    assert "click" in loaded
+    assert not loaded & set(HEAVY_MODULES)
+
+
+def test_recheck_skips_verification_stack():
+    loaded = _loaded_modules("import openpub.recheck_cmd")
+    assert not loaded & {
+        "openpub.verify_cmd",
+        "openpub.hooks",
+        "openpub.inputs",
+        "openpub.resources",
+        "openpub.scan",
+        "concurrent.futures",
+    }
+
+
+def test_lazy_verify_attribute():
+    out = _run("import openpub\nprint(openpub.verify.__module__, openpub.VerifyReport.__name__)").stdout
+    assert out.split() == ["openpub.verify_cmd", "VerifyReport"]
+
+
+def test_import_openpub_budget():
+    assert _import_time("import openpub") <= IMPORT_BUDGET_US
+
+
+def test_cli_help_budget():
+    assert _import_time(CLI_HELP) <= CLI_HELP_BUDGET_US
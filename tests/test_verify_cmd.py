@@ -1,7 +1,13 @@
 import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from openpub.registry import clear_registry
+import pytest
+
+from openpub import claim, verify
+from openpub.registry import clear_registry, get_registry
 from openpub.verify_cmd import run_verify
 
 
@@ -149,3 +155,215 @@ def test_verify_skips_underscore_files(tmp_path):
     exit_code = run_verify(str(claims_file), str(tmp_path))
     # C1 should be open since _hidden.py is skipped
     assert exit_code == 0
+
+
+def test_verify_family(tmp_path, capsys):
+    claims = [
+        {"claim_id": "C10.1", "claim": "Test", "expected": {"n": 1}},
+        {"claim_id": "C10.2", "claim": "Test", "expected": {"n": 2}},
+        {"claim_id": "C10.10", "claim": "Test", "expected": {"n": 10}},
+        {"claim_id": "C10.11", "claim": "Test", "expected": {"n": 11}},
+    ]
+    claims_file = tmp_path / "claims.json"
+    claims_file.write_text(json.dumps(claims))
+
+    analysis = tmp_path / "analysis.py"
+    analysis.write_text(
+        'from openpub import claim\n\n'
+        'calls = []\n\n'
+        '@claim.family("C10.*")\n'
+        'def verify_c10():\n'
+        '    calls.append(1)\n'
+        '    assert len(calls) == 1\n'
+        '    return {f"C10.{i}": {"n": i} for i in (1, 2, 10)} | {"C10.11": {"n": 0}}\n'
+    )
+
+    clear_registry()
+    exit_code = run_verify(str(claims_file), str(tmp_path))
+    assert exit_code == 1
+    out = capsys.readouterr().out
+    assert "VERIFIED (3)" in out
+    assert "C10.11:" in out
+    # Numeric ordering of dotted IDs
+    assert out.index("C10.2") < out.index("C10.10")
+
+
+def test_verify_family_missing_member(tmp_path, capsys):
+    claims = [
+        {"claim_id": "C10.1", "claim": "Test", "expected": {"n": 1}},
+        {"claim_id": "C10.2", "claim": "Test", "expected": {"n": 2}},
+    ]
+    claims_file = tmp_path / "claims.json"
+    claims_file.write_text(json.dumps(claims))
+
+    analysis = tmp_path / "analysis.py"
+    analysis.write_text(
+        'from openpub import claim\n\n'
+        '@claim.family("C10.*")\n'
+        'def verify_c10():\n'
+        '    return {"C10.1": {"n": 1}}\n'
+    )
+
+    clear_registry()
+    exit_code = run_verify(str(claims_file), str(tmp_path))
+    assert exit_code == 1
+    assert "returned no result for C10.2" in capsys.readouterr().out
+
+
+def test_verify_claim_overrides_family(tmp_path):
+    claims = [
+        {"claim_id": "C10.1", "claim": "Test", "expected": {"n": 1}},
+        {"claim_id": "C10.2", "claim": "Test", "expected": {"n": 2}},
+    ]
+    claims_file = tmp_path / "claims.json"
+    claims_file.write_text(json.dumps(claims))
+
+    analysis = tmp_path / "analysis.py"
+    analysis.write_text(
+        'from openpub import claim\n\n'
+        '@claim.family("C10.*")\n'
+        'def verify_c10():\n'
+        '    return {"C10.1": {"n": 1}, "C10.2": {"n": 0}}\n\n'
+        '@claim("C10.2")\n'
+        'def verify_c10_2():\n'
+        '    return {"n": 2}\n'
+    )
+
+    clear_registry()
+    exit_code = run_verify(str(claims_file), str(tmp_path))
+    assert exit_code == 0
+
+
+def _write_analysis(directory, body):
+    directory.mkdir(exist_ok=True)
+    (directory / "analysis.py").write_text("from openpub import claim\n\n" + body)
+
+
+def test_verify_api_report(tmp_path):
+    claims = [
+        {"claim_id": "C1", "claim": "Test", "expected": {"n": 10}},
+        {"claim_id": "C2", "claim": "Test", "expected": {"n": 10}},
+        {"claim_id": "C3", "claim": "Test", "expected": {"n": 10}},
+        {"claim_id": "C4", "claim": "Test", "expected": {"n": 10}},
+    ]
+    _write_analysis(
+        tmp_path,
+        '@claim("C1")\ndef verify_c1():\n    return {"n": 10}\n\n'
+        '@claim("C2")\ndef verify_c2():\n    return {"n": 9}\n\n'
+        '@claim("C3")\ndef verify_c3():\n    raise RuntimeError("oops")\n',
+    )
+
+    report = verify(claims, tmp_path)
+    assert [r.status for r in report.results] == ["verified", "failed", "error", "open"]
+    assert report["C1"].actual == {"n": 10}
+    assert report["C1"].duration >= 0
+    assert report["C2"].failures == ["n: 9 != 10"]
+    assert report["C3"].error == "oops"
+    assert not report.ok
+    assert report.exit_code == 1
+
+
+def test_verify_api_repeated_calls_isolated(tmp_path):
+    claims = [{"claim_id": "C1", "claim": "Test", "expected": {"n": 1}}]
+    _write_analysis(tmp_path / "a", '@claim("C1")\ndef verify_c1():\n    return {"n": 1}\n')
+    _write_analysis(tmp_path / "b", '@claim("C1")\ndef verify_c1():\n    return {"n": 2}\n')
+
+    @claim("C99")
+    def verify_c99():
+        return {}
+
+    assert verify(claims, tmp_path / "a").ok
+    assert not verify(claims, tmp_path / "b").ok
+    assert verify(claims, tmp_path / "a").ok
+
+    # The caller's registry is untouched and project modules don't leak
+    assert list(get_registry()) == ["C99"]
+    assert "analysis" not in sys.modules
+
+
+def test_verify_api_select(tmp_path):
+    claims = [
+        {"claim_id": "C1", "claim": "Test", "expected": {"n": 1}},
+        {"claim_id": "C2", "claim": "Test", "expected": {"n": 2}},
+    ]
+    _write_analysis(
+        tmp_path,
+        '@claim("C1")\ndef verify_c1():\n    return {"n": 1}\n\n'
+        '@claim("C2")\ndef verify_c2():\n    raise RuntimeError("should not run")\n',
+    )
+
+    report = verify(claims, tmp_path, select=["C1"])
+    assert [r.claim_id for r in report.results] == ["C1"]
+    assert report.ok
+
+
+def test_verify_api_select_string(tmp_path):
+    claims = [{"claim_id": "C1", "claim": "Test", "expected": {"n": 1}}]
+    _write_analysis(tmp_path, '@claim("C1")\ndef verify_c1():\n    return {"n": 2}\n')
+
+    report = verify(claims, tmp_path, select="C1")
+    assert [r.claim_id for r in report.results] == ["C1"]
+    assert not report.ok
+
+
+def test_verify_api_select_matches_nothing(tmp_path):
+    claims = [{"claim_id": "C1", "claim": "Test", "expected": {"n": 1}}]
+    _write_analysis(tmp_path, '@claim("C1")\ndef verify_c1():\n    return {"n": 1}\n')
+
+    report = verify(claims, tmp_path, select=["C9*"])
+    assert report.results == []
+    assert report.warnings == ["no claims match 'C9*'"]
+
+
+def test_verify_api_jobs(tmp_path):
+    claims = [{"claim_id": f"C{i}", "claim": "Test", "expected": {"n": i}} for i in range(1, 5)]
+    _write_analysis(
+        tmp_path,
+        'import threading\n\n'
+        'barrier = threading.Barrier(4, timeout=5)\n\n'
+        + "".join(
+            f'@claim("C{i}")\ndef verify_c{i}():\n    barrier.wait()\n    return {{"n": {i}}}\n\n'
+            for i in range(1, 5)
+        ),
+    )
+
+    # All four verifiers must be running at once to pass the barrier
+    report = verify(claims, tmp_path, jobs=4)
+    assert [r.status for r in report.results] == ["verified"] * 4
+
+
+def test_verify_api_concurrent_calls_serialized(tmp_path):
+    started = tmp_path / "a_started"
+    b_imported = tmp_path / "b_imported"
+    _write_analysis(
+        tmp_path / "a",
+        'import os, time\n\n'
+        '@claim("C1")\ndef verify_c1():\n'
+        f'    open({str(started)!r}, "w").close()\n'
+        '    time.sleep(0.3)\n'
+        f'    return {{"overlap": os.path.exists({str(b_imported)!r})}}\n',
+    )
+    _write_analysis(tmp_path / "b", f'open({str(b_imported)!r}, "w").close()\n')
+    claims = [{"claim_id": "C1", "claim": "Test", "expected": {"overlap": False}}]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(verify, claims, tmp_path / "a")
+        while not started.exists() and not first.done():
+            time.sleep(0.01)
+        second = pool.submit(verify, claims, tmp_path / "b")
+        assert first.result().ok
+        assert second.result()["C1"].status == "open"
+
+
+def test_verify_api_missing_claims_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        verify(tmp_path / "nonexistent.json", tmp_path)
+
+
+def test_verify_api_import_warning(tmp_path):
+    claims = [{"claim_id": "C1", "claim": "Test", "expected": {"n": 1}}]
+    (tmp_path / "broken.py").write_text("raise ImportError('nope')\n")
+
+    report = verify(claims, tmp_path)
+    assert report.warnings == ["failed to import broken.py: nope"]
+    assert report["C1"].status == "open"